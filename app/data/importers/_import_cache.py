@@ -0,0 +1,116 @@
+"""
+Cache disque des importations
+=============================
+
+Évite de re-parser un fichier inchangé entre deux sessions : le DataFrame
+importé est stocké en Parquet (métadonnées/statistiques dans un JSON à côté),
+avec une clé dérivée du chemin absolu, du mtime, de la taille et des options
+d'import. Un fichier modifié change de clé et repasse par le vrai parseur.
+
+Le cache est best-effort : toute erreur (Parquet indisponible, fichier cache
+corrompu, disque plein...) retombe silencieusement sur le parse normal.
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from .base_importer import ImportResult, ImportMetadata, DataType
+
+logger = logging.getLogger(__name__)
+
+# Répertoire de cache partagé entre sessions
+CACHE_DIR = Path.home() / ".hydroai" / "cache" / "imports"
+
+
+def cache_key(filepath: str, kwargs: dict) -> str:
+    """Clé de cache : chemin absolu + mtime + taille + options d'import"""
+    stat = os.stat(filepath)
+    raw = repr((
+        os.path.abspath(filepath),
+        stat.st_mtime_ns,
+        stat.st_size,
+        sorted(kwargs.items()),
+    ))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def load_cached_result(filepath: str, kwargs: dict) -> Optional[ImportResult]:
+    """
+    Relit un résultat d'import depuis le cache.
+
+    Returns:
+        ImportResult si le cache est valide, None sinon (cache froid ou
+        fichier source modifié).
+    """
+    try:
+        key = cache_key(filepath, kwargs)
+        data_path = CACHE_DIR / f"{key}.parquet"
+        meta_path = CACHE_DIR / f"{key}.json"
+
+        if not (data_path.exists() and meta_path.exists()):
+            return None
+
+        df = pd.read_parquet(data_path)
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            sidecar = json.load(f)
+
+        metadata = None
+        meta_dict = sidecar.get('metadata')
+        if meta_dict:
+            meta_dict['data_type'] = DataType(meta_dict['data_type'])
+            if meta_dict.get('bounds') is not None:
+                meta_dict['bounds'] = tuple(meta_dict['bounds'])
+            metadata = ImportMetadata(**meta_dict)
+
+        logger.info(f"✓ Import rejoué depuis le cache: {filepath}")
+        return ImportResult(
+            success=True,
+            data=df,
+            metadata=metadata,
+            warnings=sidecar.get('warnings', []),
+            statistics=sidecar.get('statistics', {}),
+        )
+
+    except Exception as e:
+        logger.debug(f"Cache import illisible ({e}), re-parse: {filepath}")
+        return None
+
+
+def store_result(filepath: str, kwargs: dict, result: ImportResult) -> None:
+    """Sauvegarde best-effort d'un résultat d'import (DataFrame seul)"""
+    # Seuls les résultats tabulaires sont cachés (pas de grille numpy)
+    if not result.success or result.data is None or result.grid is not None:
+        return
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        key = cache_key(filepath, kwargs)
+
+        result.data.to_parquet(CACHE_DIR / f"{key}.parquet")
+
+        sidecar = {
+            'metadata': _serialize_metadata(result.metadata),
+            'statistics': result.statistics,
+            'warnings': result.warnings,
+        }
+        with open(CACHE_DIR / f"{key}.json", 'w', encoding='utf-8') as f:
+            json.dump(sidecar, f, default=str)
+
+    except Exception as e:
+        logger.debug(f"Écriture cache import impossible: {e}")
+
+
+def _serialize_metadata(metadata: Optional[ImportMetadata]):
+    """Sérialise ImportMetadata en dict JSON (enum DataType par valeur)"""
+    if metadata is None:
+        return None
+    d = dataclasses.asdict(metadata)
+    d['data_type'] = metadata.data_type.value
+    return d
@@ -52,6 +52,7 @@ class ImportResult:
     warnings: List[str] = None                  # Avertissements (doublons, valeurs manquantes)
     errors: List[str] = None                    # Erreurs lors de l'import
     statistics: Optional[Dict[str, Any]] = None # Stats (min, max, moyenne, etc.)
+    fatal: bool = False                         # Erreur bloquante (dialogue modal côté UI)
 
     def __post_init__(self):
         if self.warnings is None:
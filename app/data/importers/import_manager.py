@@ -2,6 +2,7 @@
 Gestionnaire centralisé d'importation avec détection automatique de format
 """
 
+import collections
 import os
 from typing import Optional, Dict, Any
 from pathlib import Path
@@ -10,6 +11,7 @@ from .base_importer import BaseImporter, ImportResult, DataType
 from .csv_excel_importer import CSVTXTImporter, ExcelImporter
 from .surfer_importer import SurferImporter
 from .geospatial_importer import GeoTIFFImporter, ShapefileImporter, GeoJSONImporter
+from . import _import_cache
 
 
 class ImportManager:
@@ -35,6 +37,11 @@ class ImportManager:
         self.import_history = []
         self.last_import = None
 
+        # LRU en mémoire des derniers imports de la session
+        # (le cache disque gère la persistance entre sessions)
+        self._lru = collections.OrderedDict()
+        self._lru_capacity = 8
+
     def get_importer(self, filepath: str) -> Optional[BaseImporter]:
         """Retourne l'importateur approprié basé sur l'extension du fichier"""
         ext = Path(filepath).suffix.lower()
@@ -92,10 +99,45 @@ class ImportManager:
             # Ajouter CRS s'il est fourni
             if crs:
                 kwargs['crs'] = crs
-            
+
+            # LRU session : ré-ouvrir le même fichier inchangé est un hit O(1)
+            stat = os.stat(filepath)
+            lru_key = (os.path.abspath(filepath), stat.st_mtime_ns,
+                       stat.st_size, tuple(sorted(kwargs.items())))
+            if lru_key in self._lru:
+                self._lru.move_to_end(lru_key)
+                result = self._lru[lru_key]
+                # L'historique enregistre chaque import, hits compris
+                # (même convention que le cache disque ci-dessous)
+                self.import_history.append({
+                    'filepath': filepath,
+                    'format': importer.file_type,
+                    'rows': result.metadata.rows if result.metadata else 0,
+                    'success': True,
+                    'cached': True,
+                })
+                self.last_import = result
+                return result
+
+            # Cache disque : fichier inchangé -> relecture Parquet au lieu du parse
+            cached = _import_cache.load_cached_result(filepath, kwargs)
+            if cached is not None:
+                self.import_history.append({
+                    'filepath': filepath,
+                    'format': importer.file_type,
+                    'rows': cached.metadata.rows if cached.metadata else 0,
+                    'success': True,
+                    'cached': True,
+                })
+                self.last_import = cached
+                self._lru_store(lru_key, cached)
+                return cached
+
             result = importer.import_data(filepath, **kwargs)
-            
+
             if result.success:
+                _import_cache.store_result(filepath, kwargs, result)
+                self._lru_store(lru_key, result)
                 # Enregistrer dans l'historique
                 self.import_history.append({
                     'filepath': filepath,
@@ -119,7 +161,14 @@ class ImportManager:
             result.errors.append(f"Erreur lors de l'importation: {str(e)}")
             return result
 
-    def batch_import(self, filepaths: list, 
+    def _lru_store(self, key, result: ImportResult):
+        """Mémorise un résultat dans le LRU session (capacité bornée)"""
+        self._lru[key] = result
+        self._lru.move_to_end(key)
+        if len(self._lru) > self._lru_capacity:
+            self._lru.popitem(last=False)
+
+    def batch_import(self, filepaths: list,
                     crs: Optional[str] = None,
                     **kwargs) -> list:
         """
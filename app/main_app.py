@@ -38,6 +38,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Préchauffer les noyaux numba optionnels au démarrage (au lieu de la
+# première analyse utilisateur) ; à fixer AVANT les imports d'onglets,
+# qui tirent les modules de calcul dont les gardes de précompilation
+# s'évaluent à l'import. Voir core/calculations/piezo.py.
+os.environ.setdefault('HYDROAPP_PRECOMPILE_NUMBA', '1')
+
 # Import tabs
 from app.ui.tabs.home_tab import HomeTab
 from app.ui.tabs.essais_pompage_tab import EssaisPompageTab
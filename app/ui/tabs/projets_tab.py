@@ -5,18 +5,17 @@ Onglet Gestion Projets - Sauvegarde, chargement, historique
 """
 
 import logging
+from datetime import datetime
 from pathlib import Path
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit,
     QListWidget, QListWidgetItem, QMessageBox, QGroupBox, QGridLayout,
-    QTextEdit, QDialog, QDialogButtonBox
+    QTextEdit, QDialog, QDialogButtonBox, QStackedLayout
 )
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont, QIcon
 
-from app.project_manager import ProjectManager
-
 logger = logging.getLogger(__name__)
 
 
@@ -89,10 +88,43 @@ class ProjetsTab(QWidget):
     
     def __init__(self):
         super().__init__()
-        self.pm = ProjectManager("./projects")
+        self.pm = None  # Construit paresseusement au premier accès
+        self._name_to_row = {}  # Index nom -> ligne (création/suppression O(1))
+        self._item_pool = []    # QListWidgetItem réutilisés entre rafraîchissements
+
+        # Boîtes de dialogue préconstruites et réutilisées (évite
+        # création/destruction d'un QMessageBox à chaque action)
+        self._confirm_box = QMessageBox(
+            QMessageBox.Question, "Confirmation", "",
+            QMessageBox.Yes | QMessageBox.No, self
+        )
+        self._info_box = QMessageBox(
+            QMessageBox.Information, "Succès", "", QMessageBox.Ok, self
+        )
+        self._error_box = QMessageBox(
+            QMessageBox.Critical, "Erreur", "", QMessageBox.Ok, self
+        )
+
         self.init_ui()
         self.refresh_projects()
-    
+
+    def _show_info(self, message):
+        """Afficher message de succès (boîte réutilisée)"""
+        self._info_box.setText(message)
+        self._info_box.exec()
+
+    def _show_error(self, message):
+        """Afficher message d'erreur (boîte réutilisée)"""
+        self._error_box.setText(message)
+        self._error_box.exec()
+
+    def _pm(self):
+        """Gestionnaire projets (import/construction différés au premier besoin)"""
+        if self.pm is None:
+            from app.project_manager import ProjectManager
+            self.pm = ProjectManager("./projects")
+        return self.pm
+
     def init_ui(self):
         """Initialiser interface"""
         
@@ -126,11 +158,23 @@ class ProjetsTab(QWidget):
         actions_layout.addStretch()
         layout.addLayout(actions_layout)
         
-        # Liste projets
+        # Liste projets (empilée avec un label pour l'état vide :
+        # pas d'item placeholder à allouer/rendre)
         self.project_list = QListWidget()
         self.project_list.itemClicked.connect(self.on_project_selected)
+
+        self._empty_label = QLabel("(Aucun projet - créez-en un!)")
+        self._empty_label.setAlignment(Qt.AlignCenter)
+
+        self._list_stack = QStackedLayout()
+        self._list_stack.addWidget(self.project_list)
+        self._list_stack.addWidget(self._empty_label)
+
+        list_host = QWidget()
+        list_host.setLayout(self._list_stack)
+
         layout.addWidget(QLabel("Projets:"))
-        layout.addWidget(self.project_list)
+        layout.addWidget(list_host)
         
         # Détails projet sélectionné
         details_group = QGroupBox("📊 Détails du projet")
@@ -144,23 +188,66 @@ class ProjetsTab(QWidget):
         layout.addWidget(details_group)
     
     def refresh_projects(self):
-        """Rafraîchir liste projets"""
-        self.project_list.clear()
-        
-        success, projects, error = self.pm.list_projects()
-        
+        """Rafraîchir liste projets (scan complet, items réutilisés)"""
+        self._name_to_row.clear()
+
+        success, projects, error = self._pm().list_projects()
+
         if not success:
             QMessageBox.warning(self, "Erreur", error or "Impossible charger projets")
             return
-        
+
         if not projects:
-            self.project_list.addItem("(Aucun projet - créez-en un!)")
+            self.project_list.clear()
+            self._item_pool.clear()
+            self._list_stack.setCurrentWidget(self._empty_label)
             return
-        
-        for proj in projects:
-            item = QListWidgetItem(f"📌 {proj['name']}")
+
+        self._list_stack.setCurrentWidget(self.project_list)
+
+        for row, proj in enumerate(projects):
+            if row < len(self._item_pool):
+                # Réutiliser l'item existant (pas de réallocation)
+                item = self._item_pool[row]
+                item.setText(f"📌 {proj['name']}")
+            else:
+                item = QListWidgetItem(f"📌 {proj['name']}")
+                self._item_pool.append(item)
+                self.project_list.addItem(item)
             item.setData(Qt.UserRole, proj)
-            self.project_list.addItem(item)
+            self._name_to_row[proj['name']] = row
+
+        # Supprimer les lignes excédentaires
+        while len(self._item_pool) > len(projects):
+            self.project_list.takeItem(len(self._item_pool) - 1)
+            self._item_pool.pop()
+
+    def _add_project_item(self, proj):
+        """Ajouter un projet à la liste en place (sans re-scan complet)"""
+        if not self._name_to_row:
+            self._list_stack.setCurrentWidget(self.project_list)
+
+        item = QListWidgetItem(f"📌 {proj['name']}")
+        item.setData(Qt.UserRole, proj)
+        self._name_to_row[proj['name']] = self.project_list.count()
+        self._item_pool.append(item)
+        self.project_list.addItem(item)
+
+    def _remove_project_item(self, name):
+        """Retirer un projet de la liste en place (sans re-scan complet)"""
+        row = self._name_to_row.pop(name, None)
+        if row is None:
+            self.refresh_projects()  # Index désynchronisé : repli sur scan complet
+            return
+
+        self.project_list.takeItem(row)
+        self._item_pool.pop(row)
+        for other, r in self._name_to_row.items():
+            if r > row:
+                self._name_to_row[other] = r - 1
+
+        if not self._name_to_row:
+            self._list_stack.setCurrentWidget(self._empty_label)
     
     def on_project_selected(self, item):
         """Afficher détails projet sélectionné"""
@@ -186,16 +273,22 @@ Modifié: {proj['modified_at'][:10]}
                 QMessageBox.warning(self, "Erreur", "Nom du projet requis")
                 return
             
-            success, error = self.pm.create_project(
+            success, error = self._pm().create_project(
                 data['name'],
                 data['description']
             )
             
             if success:
-                QMessageBox.information(self, "Succès", f"Projet '{data['name']}' créé")
-                self.refresh_projects()
+                self._show_info(f"Projet '{data['name']}' créé")
+                now = datetime.now().isoformat()
+                self._add_project_item({
+                    'name': data['name'],
+                    'description': data['description'],
+                    'created_at': now,
+                    'modified_at': now
+                })
             else:
-                QMessageBox.critical(self, "Erreur", error)
+                self._show_error(error)
     
     def open_project(self):
         """Ouvrir projet"""
@@ -205,7 +298,7 @@ Modifié: {proj['modified_at'][:10]}
             return
         
         proj = item.data(Qt.UserRole)
-        success, data, error = self.pm.load_project(proj['name'])
+        success, data, error = self._pm().load_project(proj['name'])
         
         if success:
             text = f"<b>📂 {proj['name']}</b>\n"
@@ -215,9 +308,9 @@ Modifié: {proj['modified_at'][:10]}
                 text += f"{i}. {analysis['method']} - {analysis['timestamp'][:10]}\n"
             
             self.details_text.setText(text)
-            QMessageBox.information(self, "Succès", f"Projet ouvert: {proj['name']}\n\nSee details panel →")
+            self._show_info(f"Projet ouvert: {proj['name']}\n\nSee details panel →")
         else:
-            QMessageBox.critical(self, "Erreur", error)
+            self._show_error(error)
     
     def delete_project(self):
         """Supprimer projet"""
@@ -228,20 +321,19 @@ Modifié: {proj['modified_at'][:10]}
         
         proj = item.data(Qt.UserRole)
         
-        reply = QMessageBox.question(
-            self, "Confirmation",
-            f"Supprimer le projet '{proj['name']}'?\nCette action est irréversible.",
-            QMessageBox.Yes | QMessageBox.No
+        self._confirm_box.setText(
+            f"Supprimer le projet '{proj['name']}'?\nCette action est irréversible."
         )
+        reply = self._confirm_box.exec()
         
         if reply == QMessageBox.Yes:
-            success, error = self.pm.delete_project(proj['name'])
+            success, error = self._pm().delete_project(proj['name'])
             
             if success:
-                QMessageBox.information(self, "Succès", "Projet supprimé")
-                self.refresh_projects()
+                self._show_info("Projet supprimé")
+                self._remove_project_item(proj['name'])
             else:
-                QMessageBox.critical(self, "Erreur", error)
+                self._show_error(error)
     
     def export_project(self):
         """Exporter projet"""
@@ -251,14 +343,15 @@ Modifié: {proj['modified_at'][:10]}
             return
         
         proj = item.data(Qt.UserRole)
-        success, data, error = self.pm.load_project(proj['name'])
+        success, data, error = self._pm().load_project(proj['name'])
         
         if not success:
-            QMessageBox.critical(self, "Erreur", error)
+            self._show_error(error)
             return
         
         from PySide6.QtWidgets import QFileDialog
-        
+        from app.project_manager import ProjectManager
+
         filepath, _ = QFileDialog.getSaveFileName(
             self, "Exporter projet", proj['name'] + ".json", "JSON (*.json)"
         )
@@ -266,6 +359,6 @@ Modifié: {proj['modified_at'][:10]}
         if filepath:
             success, error = ProjectManager.export_project(data, filepath)
             if success:
-                QMessageBox.information(self, "Succès", f"Projet exporté:\n{filepath}")
+                self._show_info(f"Projet exporté:\n{filepath}")
             else:
-                QMessageBox.critical(self, "Erreur", error)
+                self._show_error(error)
@@ -1,9 +1,10 @@
 import tkinter as tk
 from tkinter import ttk
 import webbrowser
+import gzip
 import os
 import tempfile
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import HTTPServer, BaseHTTPRequestHandler, SimpleHTTPRequestHandler
 import threading
 import time
 
@@ -27,22 +28,7 @@ class HomeWindow(tk.Tk):
         
         # Créer une interface de fermeture
         self.create_gui()
-        
-        # Créer un fichier HTML temporaire
-        self.html_file = self.create_html_file()
-        
-        # Démarrer un serveur local
-        self.start_local_server()
-        
-        # Attendre un peu pour que le serveur démarre
-        time.sleep(1)
-        
-        # Ouvrir le navigateur
-        webbrowser.open("http://localhost:8000")
-        
-        # Créer une interface de fermeture
-        self.create_gui()
-        
+
     def create_html_file(self):
         """Créer un fichier HTML temporaire avec l'interface"""
         html_content = """<!DOCTYPE html>
@@ -163,13 +149,35 @@ class HomeWindow(tk.Tk):
     
     def start_local_server(self):
         """Démarrer un serveur HTTP local en arrière-plan"""
+        # Pré-compresser le HTML une seule fois au démarrage (pas à chaque requête)
+        with open(self.html_file, 'rb') as f:
+            html_bytes = f.read()
+        html_gz = gzip.compress(html_bytes, compresslevel=9)
+
+        class HomePageHandler(BaseHTTPRequestHandler):
+            """Sert la page d'accueil depuis la mémoire (gzip si accepté)"""
+
+            def do_GET(self):
+                accept_encoding = self.headers.get('Accept-Encoding', '')
+                use_gzip = 'gzip' in accept_encoding
+                body = html_gz if use_gzip else html_bytes
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                if use_gzip:
+                    self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Pas de log console pour chaque requête
+
         def run_server():
-            os.chdir(os.path.dirname(self.html_file))
-            handler = SimpleHTTPRequestHandler
-            server = HTTPServer(('localhost', 8000), handler)
+            server = HTTPServer(('localhost', 8000), HomePageHandler)
             self.server = server
             server.serve_forever()
-        
+
         server_thread = threading.Thread(target=run_server, daemon=True)
         server_thread.start()
     
@@ -2,28 +2,191 @@
 Fenêtre principale HydroAI avec tous les modules
 """
 
+import functools
 import sys
-import os
+from itertools import islice
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
-    QPushButton, QLabel, QFileDialog, QTableWidget, QTableWidgetItem,
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
+    QPushButton, QLabel, QFileDialog, QTableWidget, QTableView,
     QMessageBox, QStatusBar, QMenuBar, QMenu, QComboBox, QSpinBox,
     QDoubleSpinBox, QLineEdit, QFormLayout, QGroupBox, QProgressBar
 )
-from PyQt6.QtCore import Qt, QSize, QThread, pyqtSignal
+from PyQt6.QtCore import (
+    Qt, QSize, QObject, QThread, pyqtSignal, QAbstractTableModel, QModelIndex
+)
 from PyQt6.QtGui import QIcon, QColor, QPixmap, QFont
 from PyQt6.QtCore import QTimer
-import pandas as pd
+import numpy as np
+
+
+# Feuilles de style partagées : définies une fois au niveau module,
+# Qt ne re-parse pas le même CSS pour chaque bouton
+_PRIMARY_BTN_QSS = """
+    QPushButton {
+        background-color: #13a4ec;
+        color: white;
+        padding: 10px;
+        border-radius: 5px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #0d7ab3;
+    }
+"""
+
+_SUCCESS_BTN_QSS = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        padding: 10px;
+        border-radius: 5px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #3d8b40;
+    }
+"""
+
+_WARN_BTN_QSS = """
+    QPushButton {
+        background-color: #FF9800;
+        color: white;
+        padding: 10px;
+        border-radius: 5px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #e68900;
+    }
+"""
+
+_MAIN_QSS = """
+    QMainWindow {
+        background-color: #ffffff;
+    }
+    QTabWidget::pane {
+        border: 1px solid #ccc;
+    }
+    QTabBar::tab {
+        background-color: #f0f0f0;
+        padding: 8px 20px;
+        border: 1px solid #ccc;
+        border-bottom: none;
+    }
+    QTabBar::tab:selected {
+        background-color: #13a4ec;
+        color: white;
+    }
+    QGroupBox {
+        border: 1px solid #ddd;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+        font-weight: bold;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QTableWidget {
+        border: 1px solid #ddd;
+        gridline-color: #e0e0e0;
+    }
+    QHeaderView::section {
+        background-color: #f0f0f0;
+        padding: 5px;
+        border: 1px solid #ddd;
+        font-weight: bold;
+    }
+"""
+
+
+class ImportWorker(QObject):
+    """Worker d'importation exécuté hors du thread GUI"""
+
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+    def __init__(self, import_manager, filepath, x_col='X', y_col='Y'):
+        super().__init__()
+        self.import_manager = import_manager
+        self.filepath = filepath
+        self.x_col = x_col
+        self.y_col = y_col
+
+    def run(self):
+        """Lance l'import (bloquant, mais dans le thread du worker)"""
+        try:
+            result = self.import_manager.import_file(
+                self.filepath, x_col=self.x_col, y_col=self.y_col
+            )
+            self.finished.emit(result)
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class PandasModel(QAbstractTableModel):
+    """Modèle Qt adossé directement au DataFrame.
 
-# Ajouter le chemin du projet
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    Qt n'interroge que les cellules visibles : pas de QTableWidgetItem
+    alloué par ligne, l'aperçu reste O(viewport) quel que soit le fichier.
+    """
 
-from data.importers import get_import_manager
+    def __init__(self, df, parent=None):
+        super().__init__(parent)
+        self._df = df
+        # Formatage vectorisé en une passe C : évite un str(...)[:10]
+        # Python par cellule à chaque repeint du viewport
+        self._cells = np.char.mod('%.10s', df.to_numpy().astype('U64'))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._df)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._df.columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return str(self._cells[index.row(), index.column()])
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return str(self._df.columns[section])
+        return str(section + 1)
 
 
 class MainWindow(QMainWindow):
     """Fenêtre principale de HydroAI"""
-    
+
+    # QFont partagés entre onglets, construits paresseusement (après
+    # QApplication) : une seule résolution fontconfig par style
+    _TITLE_FONT = None
+    _TAB_TITLE_FONT = None
+
+    @classmethod
+    def _title_font(cls):
+        """Police du titre d'en-tête (24pt gras), construite une fois"""
+        if cls._TITLE_FONT is None:
+            f = QFont()
+            f.setPointSize(24)
+            f.setBold(True)
+            cls._TITLE_FONT = f
+        return cls._TITLE_FONT
+
+    @classmethod
+    def _tab_title_font(cls):
+        """Police des titres d'onglets (18pt gras), construite une fois"""
+        if cls._TAB_TITLE_FONT is None:
+            f = QFont()
+            f.setPointSize(18)
+            f.setBold(True)
+            cls._TAB_TITLE_FONT = f
+        return cls._TAB_TITLE_FONT
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("HydroAI - Modélisation Hydrogéologique avec IA")
@@ -31,12 +194,31 @@ class MainWindow(QMainWindow):
         
         # État de l'application
         self.current_data = None
-        self.import_manager = get_import_manager()
-        
+        self._import_manager = None  # Résolu au premier import de fichier
+
+        # Débouncing des rafraîchissements de table : les appels en rafale
+        # sont coalescés, seul le dernier DataFrame est affiché
+        self._pending_table_df = None
+        self._table_timer = QTimer(self)
+        self._table_timer.setSingleShot(True)
+        self._table_timer.setInterval(50)
+        self._table_timer.timeout.connect(self._flush_table)
+
+        # Style appliqué avant la construction des enfants : une seule passe
+        # de "polish" Qt au lieu d'un re-style complet après init_ui
+        self.setStyleSheet(_MAIN_QSS)
+
         # Créer l'interface
         self.init_ui()
-        self.apply_stylesheet()
-        
+
+    @property
+    def import_manager(self):
+        """Gestionnaire d'import (import pandas différé au premier besoin)"""
+        if self._import_manager is None:
+            from data.importers import get_import_manager
+            self._import_manager = get_import_manager()
+        return self._import_manager
+
     def init_ui(self):
         """Initialise l'interface utilisateur"""
         
@@ -53,37 +235,59 @@ class MainWindow(QMainWindow):
         header = self.create_header()
         layout.addWidget(header)
         
-        # Onglets principaux
-        tabs = QTabWidget()
-        
-        # Onglet 1: Accueil
-        tabs.addTab(self.create_home_tab(), "🏠 Accueil")
-        
-        # Onglet 2: Données
-        tabs.addTab(self.create_data_tab(), "📊 Données")
-        
-        # Onglet 3: Géométrie
-        tabs.addTab(self.create_geometry_tab(), "🔲 Géométrie")
-        
-        # Onglet 4: Simulation
-        tabs.addTab(self.create_simulation_tab(), "⚙️ Simulation")
-        
-        # Onglet 5: IA
-        tabs.addTab(self.create_ia_tab(), "🤖 IA")
-        
-        # Onglet 6: Résultats
-        tabs.addTab(self.create_results_tab(), "📈 Résultats")
-        
-        # Onglet 7: Bassin versant
-        tabs.addTab(self.create_watershed_tab(), "💧 Bassin Versant")
-        
-        layout.addWidget(tabs)
+        # Onglets principaux (construits paresseusement à la première sélection)
+        self.tabs = QTabWidget()
+
+        # Onglet 1: Accueil - visible immédiatement, construit tout de suite
+        self.tabs.addTab(self.create_home_tab(), "🏠 Accueil")
+
+        # Les autres onglets ne sont que des placeholders tant que
+        # l'utilisateur ne les visite pas
+        self._tab_builders = {}
+        for label, builder in [
+            ("📊 Données", self.create_data_tab),
+            ("🔲 Géométrie", self.create_geometry_tab),
+            ("⚙️ Simulation", self.create_simulation_tab),
+            ("🤖 IA", self.create_ia_tab),
+            ("📈 Résultats", self.create_results_tab),
+            ("💧 Bassin Versant", self.create_watershed_tab),
+        ]:
+            index = self.tabs.addTab(QWidget(), label)
+            self._tab_builders[index] = builder
+
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
+
+        layout.addWidget(self.tabs)
         
         # Barre de statut
         self.statusBar().showMessage("Prêt")
         
         central_widget.setLayout(layout)
     
+    def _ensure_tab_built(self, index):
+        """Remplace le placeholder par le vrai onglet à la première visite"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+
+        label = self.tabs.tabText(index)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, builder(), label)
+        self.tabs.setCurrentIndex(index)
+
+    def _make_dspin(self, min_=0.0, max_=1e9, dec=3):
+        """Fabrique un QDoubleSpinBox configuré (un seul point d'init)"""
+        sb = QDoubleSpinBox()
+        sb.setRange(min_, max_)
+        sb.setDecimals(dec)
+        return sb
+
+    def _make_ispin(self, min_=0, max_=1000):
+        """Fabrique un QSpinBox configuré (un seul point d'init)"""
+        sb = QSpinBox()
+        sb.setRange(min_, max_)
+        return sb
+
     def create_menu_bar(self):
         """Crée la barre de menu"""
         menubar = self.menuBar()
@@ -121,10 +325,7 @@ class MainWindow(QMainWindow):
         
         # Logo/titre
         title = QLabel("HydroAI")
-        title_font = QFont()
-        title_font.setPointSize(24)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(self._title_font())
         title.setStyleSheet("color: #13a4ec;")
         
         subtitle = QLabel("Plateforme de modélisation hydrogéologique intégrée avec IA")
@@ -149,10 +350,7 @@ class MainWindow(QMainWindow):
         
         # Titre
         title = QLabel("Bienvenue dans HydroAI")
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(self._tab_title_font())
         
         # Description
         description = QLabel(
@@ -176,50 +374,17 @@ class MainWindow(QMainWindow):
         
         btn_new = QPushButton("➕ Nouveau projet")
         btn_new.setMinimumWidth(200)
-        btn_new.setStyleSheet("""
-            QPushButton {
-                background-color: #13a4ec;
-                color: white;
-                padding: 10px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0d7ab3;
-            }
-        """)
+        btn_new.setStyleSheet(_PRIMARY_BTN_QSS)
         btn_new.clicked.connect(self.new_project)
         
         btn_open = QPushButton("📂 Ouvrir projet")
         btn_open.setMinimumWidth(200)
-        btn_open.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 10px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #3d8b40;
-            }
-        """)
+        btn_open.setStyleSheet(_SUCCESS_BTN_QSS)
         btn_open.clicked.connect(self.open_project)
         
         btn_import = QPushButton("📥 Importer données")
         btn_import.setMinimumWidth(200)
-        btn_import.setStyleSheet("""
-            QPushButton {
-                background-color: #FF9800;
-                color: white;
-                padding: 10px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #e68900;
-            }
-        """)
+        btn_import.setStyleSheet(_WARN_BTN_QSS)
         
         buttons_layout.addWidget(btn_new)
         buttons_layout.addWidget(btn_open)
@@ -244,13 +409,13 @@ class MainWindow(QMainWindow):
         import_group = QGroupBox("📥 Importation de données")
         import_layout = QVBoxLayout()
         
-        btn_import = QPushButton("Sélectionner fichier...")
-        btn_import.clicked.connect(self.import_file)
-        
+        self.btn_import = QPushButton("Sélectionner fichier...")
+        self.btn_import.clicked.connect(self.import_file)
+
         self.import_status = QLabel("Aucun fichier importé")
         self.import_status.setStyleSheet("color: #999;")
-        
-        import_layout.addWidget(btn_import)
+
+        import_layout.addWidget(self.btn_import)
         import_layout.addWidget(self.import_status)
         import_group.setLayout(import_layout)
         
@@ -258,9 +423,7 @@ class MainWindow(QMainWindow):
         data_group = QGroupBox("📊 Aperçu des données")
         data_layout = QVBoxLayout()
         
-        self.data_table = QTableWidget()
-        self.data_table.setColumnCount(5)
-        self.data_table.setHorizontalHeaderLabels(["X", "Y", "Z", "Charge", "Conductivité"])
+        self.data_table = QTableView()
         self.data_table.setMaximumHeight(300)
         
         data_layout.addWidget(self.data_table)
@@ -294,10 +457,10 @@ class MainWindow(QMainWindow):
         domain_layout = QFormLayout()
         
         domain_layout.addRow("Projection:", QLineEdit("EPSG:32632"))
-        domain_layout.addRow("Xmin (m):", QDoubleSpinBox())
-        domain_layout.addRow("Xmax (m):", QDoubleSpinBox())
-        domain_layout.addRow("Ymin (m):", QDoubleSpinBox())
-        domain_layout.addRow("Ymax (m):", QDoubleSpinBox())
+        domain_layout.addRow("Xmin (m):", self._make_dspin())
+        domain_layout.addRow("Xmax (m):", self._make_dspin())
+        domain_layout.addRow("Ymin (m):", self._make_dspin())
+        domain_layout.addRow("Ymax (m):", self._make_dspin())
         
         domain_group.setLayout(domain_layout)
         
@@ -309,19 +472,12 @@ class MainWindow(QMainWindow):
         mesh_type.addItems(["Triangulation 2D", "Extrusion 3D par couches"])
         mesh_layout.addRow("Type de maillage:", mesh_type)
         
-        mesh_layout.addRow("Taille min éléments (m):", QDoubleSpinBox())
-        mesh_layout.addRow("Taille max éléments (m):", QDoubleSpinBox())
-        mesh_layout.addRow("Nombre de couches (3D):", QSpinBox())
+        mesh_layout.addRow("Taille min éléments (m):", self._make_dspin())
+        mesh_layout.addRow("Taille max éléments (m):", self._make_dspin())
+        mesh_layout.addRow("Nombre de couches (3D):", self._make_ispin())
         
         btn_generate = QPushButton("🔧 Générer maillage")
-        btn_generate.setStyleSheet("""
-            QPushButton {
-                background-color: #13a4ec;
-                color: white;
-                padding: 8px;
-                border-radius: 5px;
-            }
-        """)
+        btn_generate.setStyleSheet(_PRIMARY_BTN_QSS)
         mesh_layout.addRow(btn_generate)
         
         mesh_group.setLayout(mesh_layout)
@@ -366,10 +522,10 @@ class MainWindow(QMainWindow):
         param_layout = QFormLayout()
         
         param_layout.addRow("Conductivité K (m/s):", QLineEdit("1e-5"))
-        param_layout.addRow("Porosité (%):", QDoubleSpinBox())
+        param_layout.addRow("Porosité (%):", self._make_dspin(max_=100.0, dec=1))
         param_layout.addRow("Coefficient d'emmagasinement:", QLineEdit("0.001"))
-        param_layout.addRow("Temps de simulation (jours):", QSpinBox())
-        param_layout.addRow("Pas de temps (jours):", QDoubleSpinBox())
+        param_layout.addRow("Temps de simulation (jours):", self._make_ispin())
+        param_layout.addRow("Pas de temps (jours):", self._make_dspin())
         
         param_group.setLayout(param_layout)
         
@@ -378,19 +534,7 @@ class MainWindow(QMainWindow):
         exec_layout = QVBoxLayout()
         
         btn_run = QPushButton("▶️ Lancer simulation")
-        btn_run.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 10px;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #3d8b40;
-            }
-        """)
+        btn_run.setStyleSheet(_SUCCESS_BTN_QSS)
         
         self.progress = QProgressBar()
         self.progress.setValue(0)
@@ -507,14 +651,7 @@ class MainWindow(QMainWindow):
         btn_export_csv = QPushButton("📊 Exporter en CSV")
         
         for btn in [btn_export_png, btn_export_pdf, btn_export_csv]:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #FF9800;
-                    color: white;
-                    padding: 8px;
-                    border-radius: 5px;
-                }
-            """)
+            btn.setStyleSheet(_WARN_BTN_QSS)
         
         export_layout.addWidget(btn_export_png)
         export_layout.addWidget(btn_export_pdf)
@@ -547,14 +684,7 @@ class MainWindow(QMainWindow):
         basin_layout = QVBoxLayout()
         
         btn_delineate = QPushButton("🎯 Délimiter bassin versant")
-        btn_delineate.setStyleSheet("""
-            QPushButton {
-                background-color: #13a4ec;
-                color: white;
-                padding: 10px;
-                border-radius: 5px;
-            }
-        """)
+        btn_delineate.setStyleSheet(_PRIMARY_BTN_QSS)
         
         basin_stats = QLabel(
             "Statistiques du bassin:\n"
@@ -575,14 +705,7 @@ class MainWindow(QMainWindow):
         export_layout = QVBoxLayout()
         
         btn_export_shp = QPushButton("📦 Exporter en Shapefile")
-        btn_export_shp.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 8px;
-                border-radius: 5px;
-            }
-        """)
+        btn_export_shp.setStyleSheet(_SUCCESS_BTN_QSS)
         
         export_layout.addWidget(btn_export_shp)
         export_group.setLayout(export_layout)
@@ -604,43 +727,106 @@ class MainWindow(QMainWindow):
             "Tous les fichiers (*.csv *.txt *.xlsx *.xls *.grd *.asc *.tif *.shp *.geojson)"
         )
         
-        if filepath:
-            result = self.import_manager.import_file(filepath, x_col='X', y_col='Y')
-            
-            if result.success:
-                self.current_data = result
-                self.import_status.setText(f"✓ {result.metadata.filename} importé ({result.metadata.rows} lignes)")
-                self.import_status.setStyleSheet("color: #4CAF50; font-weight: bold;")
-                
-                # Remplir la table
-                self.update_data_table(result.data)
-                
-                # Afficher les stats
-                self.update_stats_label(result.statistics)
-                
-                self.statusBar().showMessage(f"Fichier importé: {result.metadata.filename}")
-            else:
+        if not filepath:
+            return
+
+        # Lancer l'import dans un thread dédié : le parsing pandas/GeoTIFF
+        # ne bloque plus la boucle d'événements Qt
+        self.btn_import.setEnabled(False)
+        self.import_status.setText("⏳ Importation en cours...")
+        self.import_status.setStyleSheet("color: #FF9800;")
+        self.statusBar().showMessage(f"Importation: {filepath}")
+
+        self._import_thread = QThread()
+        self._import_worker = ImportWorker(self.import_manager, filepath, x_col='X', y_col='Y')
+        self._import_worker.moveToThread(self._import_thread)
+
+        self._import_thread.started.connect(self._import_worker.run)
+        self._import_worker.finished.connect(self._on_import_done)
+        self._import_worker.error.connect(self._on_import_error)
+        self._import_worker.finished.connect(self._import_thread.quit)
+        self._import_worker.error.connect(self._import_thread.quit)
+        self._import_thread.finished.connect(self._import_worker.deleteLater)
+        self._import_thread.finished.connect(self._import_thread.deleteLater)
+
+        self._import_thread.start()
+
+    def _on_import_done(self, result):
+        """Callback thread GUI : résultat d'import disponible"""
+        self.btn_import.setEnabled(True)
+
+        if result.success:
+            self.current_data = result
+            self.import_status.setText(f"✓ {result.metadata.filename} importé ({result.metadata.rows} lignes)")
+            self.import_status.setStyleSheet("color: #4CAF50; font-weight: bold;")
+
+            # Remplir la table
+            self.update_data_table(result.data)
+
+            # Afficher les stats
+            self.update_stats_label(result.statistics)
+
+            self.statusBar().showMessage(f"Fichier importé: {result.metadata.filename}")
+        else:
+            self.import_status.setText("✗ Importation échouée")
+            self.import_status.setStyleSheet("color: #f44336;")
+            # Chemin froid : les erreurs bénignes (parse, format...) passent par
+            # la barre de statut, le dialogue modal est réservé aux fatales
+            if getattr(result, 'fatal', False):
                 QMessageBox.critical(self, "Erreur", "\n".join(result.errors))
+            elif result.errors:
+                self.statusBar().showMessage(f"Erreur: {result.errors[0]}", 5000)
+
+    def _on_import_error(self, message):
+        """Callback thread GUI : exception pendant l'import"""
+        self.btn_import.setEnabled(True)
+        self.import_status.setText("✗ Importation échouée")
+        self.import_status.setStyleSheet("color: #f44336;")
+        QMessageBox.critical(self, "Erreur", message)
     
-    def update_data_table(self, data):
-        """Met à jour la table de données"""
-        self.data_table.setRowCount(len(data))
-        
-        for row, (_, row_data) in enumerate(data.iterrows()):
-            for col, (col_name, value) in enumerate(row_data.items()):
-                if col < 5:  # Limiter à 5 colonnes
-                    item = QTableWidgetItem(str(value)[:10])
-                    self.data_table.setItem(row, col, item)
+    def update_data_table(self, data, immediate=False):
+        """Met à jour la table de données (rafraîchissement débouncé 50 ms)"""
+        self._pending_table_df = data
+        if immediate:
+            self._table_timer.stop()
+            self._flush_table()
+        else:
+            self._table_timer.start()
+
+    def _flush_table(self):
+        """Applique le dernier DataFrame en attente au modèle de la table"""
+        data = self._pending_table_df
+        if data is None:
+            return
+        self._pending_table_df = None
+
+        # Le modèle référence le DataFrame sans copier ni créer d'items :
+        # seules les cellules du viewport sont formatées à l'affichage
+        self._data_model = PandasModel(data)
+        self.data_table.setModel(self._data_model)
     
-    def update_stats_label(self, stats):
-        """Met à jour les statistiques"""
-        text = "Statistiques:\n"
-        for key, value in list(stats.items())[:10]:
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _render_stats(items):
+        """Formate les statistiques (mémoïsé : ré-import du même fichier = hit)"""
+        parts = ["Statistiques:"]
+        for key, value in items:
             if isinstance(value, float):
-                text += f"• {key}: {value:.4f}\n"
+                parts.append(f"• {key}: {value:.4f}")
             else:
-                text += f"• {key}: {value}\n"
-        
+                parts.append(f"• {key}: {value}")
+        return "\n".join(parts) + "\n"
+
+    def update_stats_label(self, stats):
+        """Met à jour les statistiques"""
+        # islice : ne matérialise que les 10 premières paires
+        items = tuple(islice(stats.items(), 10))
+        try:
+            text = self._render_stats(items)
+        except TypeError:
+            # Valeur non hashable : rendu direct sans cache
+            text = MainWindow._render_stats.__wrapped__(items)
+
         self.stats_label.setText(text)
     
     def new_project(self):
@@ -662,54 +848,14 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage("Projet enregistré")
     
     def apply_stylesheet(self):
-        """Applique le style global"""
-        stylesheet = """
-            QMainWindow {
-                background-color: #ffffff;
-            }
-            QTabWidget::pane {
-                border: 1px solid #ccc;
-            }
-            QTabBar::tab {
-                background-color: #f0f0f0;
-                padding: 8px 20px;
-                border: 1px solid #ccc;
-                border-bottom: none;
-            }
-            QTabBar::tab:selected {
-                background-color: #13a4ec;
-                color: white;
-            }
-            QGroupBox {
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QTableWidget {
-                border: 1px solid #ddd;
-                gridline-color: #e0e0e0;
-            }
-            QHeaderView::section {
-                background-color: #f0f0f0;
-                padding: 5px;
-                border: 1px solid #ddd;
-                font-weight: bold;
-            }
-        """
-        self.setStyleSheet(stylesheet)
+        """Ré-applique le style global (changement de thème à chaud)"""
+        self.setStyleSheet(_MAIN_QSS)
 
 
 def main():
     """Fonction principale"""
-    app = __import__('PyQt6.QtWidgets', fromlist=['QApplication']).QApplication(sys.argv)
-    
+    app = QApplication(sys.argv)
+
     window = MainWindow()
     window.show()
     
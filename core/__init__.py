@@ -25,14 +25,6 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
-from . import calculations
-from . import solver
-from . import mesh
-from . import io
-from . import ai
-from . import post
-from . import project
-
 __all__ = [
     'calculations',
     'solver',
@@ -42,3 +34,17 @@ __all__ = [
     'post',
     'project',
 ]
+
+
+def __getattr__(name):
+    """Import paresseux des sous-modules (PEP 562).
+
+    `import core.ai` ne tire plus scipy/matplotlib via solver/mesh/post :
+    chaque sous-module n'est chargé qu'au premier accès.
+    """
+    if name in __all__:
+        import importlib
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,95 @@
+"""
+Cache disque des analyses IA
+============================
+
+Mémoïse les résultats des analyses (détection d'anomalies, recommandations,
+validations) entre sessions : la clé est dérivée du contenu des tableaux et
+des paramètres, donc des données inchangées rejouent le résultat stocké au
+lieu de relancer le calcul.
+
+Le cache est best-effort : toute erreur (shelve indisponible, résultat non
+picklable, disque plein...) retombe silencieusement sur le calcul direct.
+"""
+
+import functools
+import hashlib
+import logging
+import shelve
+import threading
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Répertoire de cache partagé entre sessions
+CACHE_DIR = Path.home() / ".hydroai" / "cache" / "ai"
+
+_lock = threading.Lock()
+_shelf = None
+
+
+def _get_shelf():
+    """Ouvre le shelf une seule fois par processus"""
+    global _shelf
+    if _shelf is None:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _shelf = shelve.open(str(CACHE_DIR / "results"))
+    return _shelf
+
+
+def _hash_value(h, value):
+    """Alimente le hash avec une valeur (tableaux hashés par contenu)"""
+    if isinstance(value, np.ndarray):
+        h.update(str(value.dtype).encode())
+        h.update(str(value.shape).encode())
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        for key in sorted(value, key=repr):
+            h.update(repr(key).encode())
+            _hash_value(h, value[key])
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _hash_value(h, item)
+    else:
+        h.update(repr(value).encode())
+
+
+def cache_key(func_name: str, args, kwargs) -> str:
+    """Clé de cache : nom de la fonction + contenu des arguments"""
+    h = hashlib.blake2b(digest_size=20)
+    h.update(func_name.encode())
+    _hash_value(h, args)
+    _hash_value(h, kwargs)
+    return h.hexdigest()
+
+
+def cached_ai(func):
+    """Décorateur : mémoïse une méthode d'analyse IA sur disque.
+
+    À réserver aux méthodes pures (le résultat ne dépend que des arguments).
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            key = cache_key(func.__qualname__, args, kwargs)
+            with _lock:
+                shelf = _get_shelf()
+                if key in shelf:
+                    return shelf[key]
+        except Exception as e:
+            logger.debug(f"Cache IA illisible ({e}), calcul direct")
+            return func(self, *args, **kwargs)
+
+        result = func(self, *args, **kwargs)
+
+        try:
+            with _lock:
+                shelf[key] = result
+                shelf.sync()
+        except Exception as e:
+            logger.debug(f"Écriture cache IA impossible: {e}")
+
+        return result
+
+    return wrapper
@@ -7,12 +7,108 @@ Méthodes simples et explicables (pas de boîte noire).
 """
 
 import numpy as np
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import cdist
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
 import logging
 
+from ._cache import cached_ai
+
 logger = logging.getLogger(__name__)
 
 
+def _scan_matrix(arr: np.ndarray, z_threshold: float):
+    """
+    Scan fusionné d'un lot de variables empilées en matrice (K, N) :
+    moyennes/écarts-types, quartiles et masques z-score + IQR calculés en
+    réductions 2D, une par statistique pour tout le lot.
+
+    Returns:
+        (z_scores, z_mask, iqr_mask, means, lower_bounds, upper_bounds)
+    """
+    means = arr.mean(axis=1, keepdims=True)
+    stds = arr.std(axis=1, keepdims=True)
+    Q1, Q3 = np.quantile(arr, (0.25, 0.75), axis=1, keepdims=True)
+    IQR = Q3 - Q1
+    lower_bounds = Q1 - 1.5 * IQR
+    upper_bounds = Q3 + 1.5 * IQR
+
+    # Variable constante (std ~ 0) -> jamais anomalie (division par inf)
+    z_scores = np.abs(arr - means) / np.where(stds > 1e-10, stds, np.inf)
+    z_mask = z_scores > z_threshold
+
+    iqr_mask = (arr < lower_bounds) | (arr > upper_bounds)
+
+    return z_scores, z_mask, iqr_mask, means, lower_bounds, upper_bounds
+
+
+class _LazyExplanations:
+    """Séquence d'explications formatées à la demande.
+
+    Se comporte comme une liste (len, indexation, itération) mais ne paie
+    le coût des f-strings que pour les éléments réellement consultés —
+    un résumé qui ne lit pas le détail ne formate rien.
+    """
+
+    def __init__(self, indices, fmt):
+        self._indices = indices
+        self._fmt = fmt
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __getitem__(self, pos):
+        if isinstance(pos, slice):
+            return [self._fmt(i) for i in self._indices[pos]]
+        return self._fmt(self._indices[pos])
+
+    def __iter__(self):
+        for i in self._indices:
+            yield self._fmt(i)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+def _knn_indices_cdist(coords: np.ndarray, k: int, metric: str,
+                       block: int = 512) -> np.ndarray:
+    """
+    k plus proches voisins par distances explicites, pour les métriques
+    que le kd-tree ne couvre pas.
+
+    La matrice de distances est calculée par blocs de lignes : chaque
+    bloc (block, N) tient en cache et est libéré avant le suivant, au
+    lieu d'une matrice N×N complète (72 Mo dès N=3000). argpartition
+    évite le tri complet de chaque ligne.
+
+    Returns:
+        Matrice (N, k) d'indices de voisins, le point lui-même en tête
+    """
+    N = len(coords)
+    out = np.empty((N, k), dtype=np.intp)
+    for start in range(0, N, block):
+        D = cdist(coords[start:start + block], coords, metric=metric)
+        part = np.argpartition(D, k - 1, axis=1)[:, :k]
+        # argpartition ne trie pas les k retenus : ordre final par distance
+        rows = np.arange(len(D))[:, None]
+        order = np.argsort(D[rows, part], axis=1)
+        out[start:start + block] = part[rows, order]
+    return out
+
+
+def _as_float_array(data: np.ndarray) -> np.ndarray:
+    """Convertit en flottant sans copier un tableau déjà float32/float64.
+
+    np.asarray(data, dtype=float) recopiait (et doublait) les entrées
+    float32 ; ici le dtype flottant d'origine est conservé.
+    """
+    data = np.asarray(data)
+    if data.dtype.kind != 'f':
+        data = data.astype(np.float64, copy=False)
+    return data
+
+
 class AnomalyDetector:
     """
     Détection d'anomalies basée sur statistiques simples et explicables.
@@ -26,6 +122,9 @@ class AnomalyDetector:
         self.confidence_threshold = confidence_threshold
         self.anomalies = []
         self.explanations = []
+        # Tampon Z-score réutilisé entre appels (agrandi au besoin) :
+        # les balayages répétés de séries de même taille n'allouent plus
+        self._z_buf = np.empty(0)
         
     def detect_outliers_zscore(self, data: np.ndarray, threshold: float = 3.0) -> Tuple[np.ndarray, List[str]]:
         """
@@ -41,25 +140,73 @@ class AnomalyDetector:
         Returns:
             (indices_anomalies, explications)
         """
-        data = np.asarray(data, dtype=float)
-        
+        data = _as_float_array(data)
+
         mean = np.mean(data)
         std = np.std(data)
-        
+
         if std < 1e-10:
             return np.array([]), []
-        
-        z_scores = np.abs((data - mean) / std)
-        anomaly_indices = np.where(z_scores > threshold)[0]
-        
-        explanations = [
-            f"Point {idx}: valeur={data[idx]:.2f}, Z-score={z_scores[idx]:.2f} "
-            f"(à {z_scores[idx]:.1f}σ de la moyenne {mean:.2f})"
-            for idx in anomaly_indices
-        ]
-        
+
+        # Z-scores en place dans le tampon partagé : une seule passe
+        # mémoire, zéro allocation quand la taille ne croît pas
+        if self._z_buf.size < data.size:
+            self._z_buf = np.empty(data.size)
+        z_scores = self._z_buf[:data.size]
+        np.subtract(data, mean, out=z_scores)
+        np.divide(z_scores, std, out=z_scores)
+        np.abs(z_scores, out=z_scores)
+        anomaly_indices = np.flatnonzero(z_scores > threshold)
+
+        # Copie des Z anormaux (peu nombreux) : le tampon sera réécrit
+        # par le prochain appel, les explications restent paresseuses
+        z_by_idx = dict(zip(anomaly_indices.tolist(),
+                            z_scores[anomaly_indices]))
+        explanations = _LazyExplanations(
+            anomaly_indices,
+            lambda idx: (
+                f"Point {idx}: valeur={data[idx]:.2f}, Z-score={z_by_idx[idx]:.2f} "
+                f"(à {z_by_idx[idx]:.1f}σ de la moyenne {mean:.2f})"
+            )
+        )
+
         return anomaly_indices, explanations
-    
+
+    def detect_outliers_zscore_batch(self, matrix: np.ndarray,
+                                     threshold: float = 3.0,
+                                     axis: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Z-score par lot sur une matrice (capteur × temps).
+
+        Chaque ligne (ou colonne selon `axis`) est centrée-réduite sur
+        ses propres moyenne et écart-type en une passe vectorielle — un
+        parc de capteurs se balaie d'un coup au lieu d'une boucle
+        d'appels 1D. Les lignes constantes (écart-type ~0) ne signalent
+        rien.
+
+        Args:
+            matrix (np.ndarray): Données 2D (n_capteurs, n_mesures)
+            threshold (float): Seuil Z (typiquement 2-3 sigmas)
+            axis (int): Axe des mesures (1 = par ligne)
+
+        Returns:
+            (indices_lignes, indices_colonnes) des anomalies, à la
+            manière de np.where
+        """
+        matrix = _as_float_array(np.atleast_2d(matrix))
+
+        mean = matrix.mean(axis=axis, keepdims=True)
+        std = matrix.std(axis=axis, keepdims=True)
+        # Écart-type nul : division neutralisée, la ligne ne peut pas
+        # dépasser le seuil
+        np.maximum(std, 1e-10, out=std)
+
+        dev = np.subtract(matrix, mean)
+        np.divide(dev, std, out=dev)
+        np.abs(dev, out=dev)
+
+        return np.where(dev > threshold)
+
     def detect_outliers_iqr(self, data: np.ndarray) -> Tuple[np.ndarray, List[str]]:
         """
         Détection par IQR (InterQuartile Range).
@@ -73,70 +220,78 @@ class AnomalyDetector:
         Returns:
             (indices_anomalies, explications)
         """
-        data = np.asarray(data, dtype=float)
+        data = _as_float_array(data)
         
-        Q1 = np.percentile(data, 25)
-        Q3 = np.percentile(data, 75)
+        # Un seul tri pour les deux quartiles (au lieu de deux percentile)
+        Q1, Q3 = np.quantile(data, (0.25, 0.75))
         IQR = Q3 - Q1
         
         lower_bound = Q1 - 1.5 * IQR
         upper_bound = Q3 + 1.5 * IQR
         
         anomaly_indices = np.where((data < lower_bound) | (data > upper_bound))[0]
-        
-        explanations = [
-            f"Point {idx}: valeur={data[idx]:.2f} en dehors [{lower_bound:.2f}, {upper_bound:.2f}]"
-            for idx in anomaly_indices
-        ]
-        
+
+        explanations = _LazyExplanations(
+            anomaly_indices,
+            lambda idx: (
+                f"Point {idx}: valeur={data[idx]:.2f} "
+                f"en dehors [{lower_bound:.2f}, {upper_bound:.2f}]"
+            )
+        )
+
         return anomaly_indices, explanations
     
+    @cached_ai
     def detect_spatial_outliers(self, x: np.ndarray, y: np.ndarray, z: np.ndarray,
-                                 threshold_neighbors: int = 5) -> Tuple[np.ndarray, List[str]]:
+                                 threshold_neighbors: int = 5,
+                                 metric: str = 'euclidean') -> Tuple[np.ndarray, List[str]]:
         """
         Détection spatiale : isolé de ses voisins.
-        
+
         Un point est anomalie s'il diffère grandement de ses k plus proches voisins.
         Explicable : "Valeur isolée dans le voisinage spatial"
-        
+
         Args:
             x, y, z : Coordonnées + propriété
             threshold_neighbors: Nombre de voisins pour comparaison
-            
+            metric: Métrique de distance ('euclidean' = kd-tree, sinon
+                calcul par blocs de distances explicites)
+
         Returns:
             (indices_anomalies, explications)
         """
-        from scipy.spatial.distance import cdist
-        
-        x, y, z = np.asarray(x), np.asarray(y), np.asarray(z, dtype=float)
-        
-        # Distance euclidienne en (x,y)
+        x, y, z = np.asarray(x), np.asarray(y), _as_float_array(z)
+
         coords = np.column_stack([x, y])
-        distances = cdist(coords, coords, metric='euclidean')
-        
-        anomaly_indices = []
-        explanations = []
-        
-        for i in range(len(z)):
-            # k plus proches voisins (excl. le point lui-même)
-            nearest = np.argsort(distances[i])[1:threshold_neighbors+1]
-            
-            z_neighbors = z[nearest]
-            z_mean_neighbors = np.mean(z_neighbors)
-            z_std_neighbors = np.std(z_neighbors)
-            
-            if z_std_neighbors > 1e-10:
-                z_dev = np.abs(z[i] - z_mean_neighbors) / z_std_neighbors
-                
-                if z_dev > 3.0:  # 3 sigma par rapport au voisinage
-                    anomaly_indices.append(i)
-                    explanations.append(
-                        f"Point {i} (x={x[i]:.1f}, y={y[i]:.1f}): z={z[i]:.2f} "
-                        f"vs voisins moyen={z_mean_neighbors:.2f} (écart: {z_dev:.1f}σ)"
-                    )
-        
-        return np.array(anomaly_indices), explanations
+        k = min(threshold_neighbors + 1, len(z))
+        if metric == 'euclidean':
+            # k plus proches voisins via kd-tree : O(N log N) au lieu de la
+            # matrice de distances complète N×N (mémoire et tri par ligne)
+            tree = cKDTree(coords)
+            _, neighbor_idx = tree.query(coords, k=k, workers=-1)
+            neighbor_idx = np.atleast_2d(neighbor_idx)
+        else:
+            neighbor_idx = _knn_indices_cdist(coords, k, metric)
+
+        # Statistiques de voisinage vectorisées sur la matrice (N, k) :
+        # trois réductions numpy au lieu de trois appels par point
+        z_nb = z[neighbor_idx[:, 1:]]
+        z_mean = z_nb.mean(axis=1)
+        z_std = z_nb.std(axis=1)
+
+        # Voisinage constant (std ~ 0) -> jamais anomalie (division par inf)
+        z_dev = np.abs(z - z_mean) / np.where(z_std > 1e-10, z_std, np.inf)
+        anomaly_indices = np.flatnonzero(z_dev > 3.0)  # 3 sigma vs voisinage
+
+        explanations = [
+            f"Point {i} (x={x[i]:.1f}, y={y[i]:.1f}): z={z[i]:.2f} "
+            f"vs voisins moyen={z_mean[i]:.2f} (écart: {z_dev[i]:.1f}σ)"
+            for i in anomaly_indices
+        ]
+
+        return anomaly_indices, explanations
     
+    @cached_ai
     def comprehensive_check(self, data_dict: Dict) -> Dict:
         """
         Check complet d'une série de données (multidimensionnelle).
@@ -147,30 +302,66 @@ class AnomalyDetector:
         Returns:
             Dict avec résumé anomalies et confiance globale
         """
-        all_anomalies = []
-        all_explanations = []
-        
+        # Agrégation en colonnes parallèles (SoA) : les indices finissent en
+        # tableau numpy, filtrables par masque en aval
+        agg_var = []
+        agg_idx = []
+        agg_exp = []
+
+        # Variables groupées par longueur : chaque groupe est empilé en
+        # matrice (K, N) et scanné via des réductions 2D partagées, au lieu
+        # de K jeux de petites réductions par variable. Le nombre total de
+        # points est accumulé dans la même passe (un seul parcours du dict)
+        num_points = 0
+        groups: Dict[int, list] = {}
         for var_name, data in data_dict.items():
-            if data is None or len(data) == 0:
+            if data is None:
                 continue
-            
-            data = np.asarray(data, dtype=float)
-            
+            data = _as_float_array(data)
+            num_points += data.size
+            if data.size == 0:
+                continue
+            groups.setdefault(len(data), []).append((var_name, data))
+
+        # Les groupes sont indépendants et les réductions numpy relâchent
+        # le GIL : au-delà d'un groupe, les scans tournent en parallèle.
+        # L'agrégation (formatage des messages) reste séquentielle, ordre
+        # d'insertion préservé.
+        stacked = [np.stack([data for _, data in group])
+                   for group in groups.values()]
+        if len(stacked) > 1:
+            with ThreadPoolExecutor(max_workers=len(stacked)) as executor:
+                scans = list(executor.map(
+                    lambda arr: _scan_matrix(arr, z_threshold=2.5), stacked))
+        else:
+            scans = [_scan_matrix(arr, z_threshold=2.5) for arr in stacked]
+
+        for group, arr, scan in zip(groups.values(), stacked, scans):
+            z_scores, z_mask, iqr_mask, means, lowers, uppers = scan
+
             # Z-score
-            idx_z, exp_z = self.detect_outliers_zscore(data, threshold=2.5)
-            for i, e in zip(idx_z, exp_z):
-                all_anomalies.append((var_name, i, e))
-                all_explanations.append(e)
-            
-            # IQR
-            idx_iqr, exp_iqr = self.detect_outliers_iqr(data)
-            for i, e in zip(idx_iqr, exp_iqr):
-                if (var_name, i) not in [(a[0], a[1]) for a in all_anomalies]:
-                    all_anomalies.append((var_name, i, e))
-                    all_explanations.append(e)
+            for vi, i in np.argwhere(z_mask):
+                agg_var.append(group[vi][0])
+                agg_idx.append(int(i))
+                agg_exp.append(
+                    f"Point {i}: valeur={arr[vi, i]:.2f}, "
+                    f"Z-score={z_scores[vi, i]:.2f} "
+                    f"(à {z_scores[vi, i]:.1f}σ de la moyenne {means[vi, 0]:.2f})"
+                )
+
+            # IQR (hors points déjà signalés par le z-score : dédup par masque)
+            for vi, i in np.argwhere(iqr_mask & ~z_mask):
+                agg_var.append(group[vi][0])
+                agg_idx.append(int(i))
+                agg_exp.append(
+                    f"Point {i}: valeur={arr[vi, i]:.2f} "
+                    f"en dehors [{lowers[vi, 0]:.2f}, {uppers[vi, 0]:.2f}]"
+                )
+
+        all_anomalies = list(zip(agg_var, agg_idx, agg_exp))  # Compat AoS
+        all_explanations = agg_exp
         
         # Confiance globale
-        num_points = sum(len(v) for v in data_dict.values() if v is not None)
         contamination_rate = len(all_anomalies) / max(num_points, 1)
         
         if contamination_rate < 0.05:
@@ -192,7 +383,13 @@ class AnomalyDetector:
             'confidence_score': confidence_score,
             'status': status,
             'anomalies': all_anomalies,
-            'explanations': all_explanations
+            'explanations': all_explanations,
+            # Colonnes SoA : requêtes vectorisées en aval
+            # (ex. anomalies_idx[np.array(anomalies_var) == 'K'])
+            'anomalies_var': agg_var,
+            'anomalies_idx': np.fromiter(agg_idx, dtype=np.int32,
+                                         count=len(agg_idx)),
+            'anomalies_exp': agg_exp,
         }
     
     def get_recommendations(self, anomaly_report: Dict) -> List[str]:
@@ -218,16 +415,25 @@ def simple_anomaly_score(data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     Returns:
         (scores, explanations)
     """
-    detector = AnomalyDetector()
-    
-    z_scores = np.abs((data - np.mean(data)) / (np.std(data) + 1e-10))
-    
+    data = _as_float_array(data)
+
+    # Calcul fusionné en place : deux tampons au lieu de six passes/temporaires
+    inv_std = 1.0 / (np.std(data) + 1e-10)
+    z_scores = data - np.mean(data)
+    np.abs(z_scores, out=z_scores)
+    z_scores *= inv_std
+
     # Mappage : Z~3 -> score 50%, Z~5 -> score 100%
-    scores = np.minimum(100 * z_scores / 3, 100)
-    
-    explanations = [
-        f"Point {i}: Z-score={z:.2f}, score anomalie={s:.0f}/100"
-        for i, (z, s) in enumerate(zip(z_scores, scores))
-    ]
-    
+    scores = z_scores * (100.0 / 3.0)
+    np.minimum(scores, 100.0, out=scores)
+
+    # N explications potentielles : formatées seulement si consultées
+    explanations = _LazyExplanations(
+        range(len(data)),
+        lambda i: (
+            f"Point {i}: Z-score={z_scores[i]:.2f}, "
+            f"score anomalie={scores[i]:.0f}/100"
+        )
+    )
+
     return scores, explanations
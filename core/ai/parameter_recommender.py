@@ -8,12 +8,35 @@ basé sur contexte géologique (lithologie, profondeur, région).
 Pédagogique : explique pourquoi cette plage est recommandée.
 """
 
+import copy
+import math
+
 import numpy as np
 from typing import Dict, Tuple, Optional
 import logging
 
+from ._cache import cached_ai
+
 logger = logging.getLogger(__name__)
 
+# Tables de correspondance K -> lithologie/porosité : une recherche binaire
+# C (searchsorted) remplace la chaîne de comparaisons Python, et s'applique
+# aussi bien à un scalaire qu'à une grille entière de K
+_K_THRESHOLDS = np.array([1e-9, 1e-7, 1e-5, 1e-3])
+_LITHO_NAMES = np.array(['roche_massive', 'argile', 'silt_limon', 'sables', 'graviers'])
+_POROSITY_THRESHOLDS = np.array([1e-7, 1e-5, 1e-3])
+_POROSITY_TABLE = np.array([0.05, 0.42, 0.32, 0.38])
+
+
+def guess_lithology_vectorized(K_ms: np.ndarray) -> np.ndarray:
+    """Lithologie probable pour un tableau de K (m/s)."""
+    return _LITHO_NAMES[np.searchsorted(_K_THRESHOLDS, K_ms)]
+
+
+def estimate_porosity_vectorized(K_ms: np.ndarray) -> np.ndarray:
+    """Porosité moyenne estimée pour un tableau de K (m/s)."""
+    return _POROSITY_TABLE[np.searchsorted(_POROSITY_THRESHOLDS, K_ms)]
+
 
 class ParameterRecommender:
     """
@@ -66,75 +89,27 @@ class ParameterRecommender:
     def recommend_from_lithology(self, lithology: str) -> Dict:
         """
         Recommande paramètres basés sur lithologie.
-        
+
         Args:
             lithology (str): Type de roche/sol
-            
+
         Returns:
             Dict avec plages recommandées et explications
         """
-        if lithology not in self.LITHOLOGY_DATABASE:
+        cached = self._LITHOLOGY_CACHE.get(lithology)
+        if cached is None:
             return {
                 'success': False,
                 'error': f"Lithologie '{lithology}' inconnue",
                 'available': list(self.LITHOLOGY_DATABASE.keys())
             }
-        
-        db = self.LITHOLOGY_DATABASE[lithology]
-        
-        K_min, K_max = db['K_ms']
-        K_mid = (K_min + K_max) ** 0.5  # Moyenne géométrique
-        
-        return {
-            'success': True,
-            'lithology': lithology,
-            'description': db['description'],
-            'K_ms': {
-                'min': K_min,
-                'max': K_max,
-                'typical': K_mid,
-                'unit': 'm/s'
-            },
-            'K_md': {
-                'min': K_min * 86400,
-                'max': K_max * 86400,
-                'typical': K_mid * 86400,
-                'unit': 'm/day'
-            },
-            'porosity': {
-                'min': db['porosite'][0],
-                'max': db['porosite'][1],
-                'unit': 'fraction',
-                'percent': {
-                    'min': db['porosite'][0] * 100,
-                    'max': db['porosite'][1] * 100,
-                    'unit': '%'
-                }
-            },
-            'storage_coefficient': {
-                'min': db['storage'][0],
-                'max': db['storage'][1],
-                'unit': 'dimensionless'
-            },
-            'explanation': f"""
-Recommandation pour {lithology.upper()}
-{'='*40}
-
-Type d'aquifère: {db['description']}
 
-Paramètres typiques :
-  • Conductivité K: {K_min:.2e} - {K_max:.2e} m/s
-                    ({K_min*86400:.2e} - {K_max*86400:.2e} m/jour)
-  • Porosité: {db['porosite'][0]*100:.0f} - {db['porosite'][1]*100:.0f}%
-  • Coefficient emmagasinement: {db['storage'][0]:.2e} - {db['storage'][1]:.2e}
+        # Copie profonde : les sous-dicts (K_ms, porosity...) seraient
+        # sinon partagés avec le cache module, qu'une mutation de
+        # l'appelant corromprait pour tous les appels suivants
+        return copy.deepcopy(cached)
 
-Conseil pédagogique:
-  → Utiliser la valeur typique pour les calculs préalables
-  → Tester la sensibilité avec min et max
-  → Affiner avec mesures in situ (Lefranc, Lugeon, Theis)
-            """
-        }
-    
+    @cached_ai
     def recommend_from_measured_data(self, measured_values: Dict) -> Dict:
         """
         Suggère paramètres inconnus à partir de mesures partielles.
@@ -178,30 +153,11 @@ Conseil pédagogique:
     
     def _guess_lithology_from_k(self, K_ms: float) -> str:
         """Estime lithologie probable à partir de K."""
-        K = K_ms
-        
-        if K > 1e-3:
-            return 'graviers'
-        elif K > 1e-5:
-            return 'sables'
-        elif K > 1e-7:
-            return 'silt_limon'
-        elif K > 1e-9:
-            return 'argile'
-        else:
-            return 'roche_massive'
-    
+        return str(guess_lithology_vectorized(K_ms))
+
     def _estimate_porosity_from_k(self, K_ms: float) -> float:
         """Estime porosité moyenne à partir de K (corrélation empirique)."""
-        # Corrélation simplifiée
-        if K_ms > 1e-3:
-            return 0.38
-        elif K_ms > 1e-5:
-            return 0.32
-        elif K_ms > 1e-7:
-            return 0.42
-        else:
-            return 0.05
+        return float(estimate_porosity_vectorized(K_ms))
     
     def _compute_confidence(self, measured_values: Dict) -> float:
         """Calcule confiance en recommandations (0-100)."""
@@ -213,6 +169,102 @@ Conseil pédagogique:
             return 40
 
 
+def _build_recommendation(lithology: str, db: Dict) -> Dict:
+    """Construit la recommandation complète d'une lithologie.
+
+    Évalué une seule fois à l'import (la base est statique) : chaque appel
+    de recommend_from_lithology devient un lookup au lieu de reformater
+    conversions et texte pédagogique.
+    """
+    K_min, K_max = db['K_ms']
+    K_mid = math.sqrt(K_min * K_max)  # Moyenne géométrique
+
+    return {
+        'success': True,
+        'lithology': lithology,
+        'description': db['description'],
+        'K_ms': {
+            'min': K_min,
+            'max': K_max,
+            'typical': K_mid,
+            'unit': 'm/s'
+        },
+        'K_md': {
+            'min': K_min * 86400,
+            'max': K_max * 86400,
+            'typical': K_mid * 86400,
+            'unit': 'm/day'
+        },
+        'porosity': {
+            'min': db['porosite'][0],
+            'max': db['porosite'][1],
+            'unit': 'fraction',
+            'percent': {
+                'min': db['porosite'][0] * 100,
+                'max': db['porosite'][1] * 100,
+                'unit': '%'
+            }
+        },
+        'storage_coefficient': {
+            'min': db['storage'][0],
+            'max': db['storage'][1],
+            'unit': 'dimensionless'
+        },
+        'explanation': f"""
+Recommandation pour {lithology.upper()}
+{'='*40}
+
+Type d'aquifère: {db['description']}
+
+Paramètres typiques :
+  • Conductivité K: {K_min:.2e} - {K_max:.2e} m/s
+                    ({K_min*86400:.2e} - {K_max*86400:.2e} m/jour)
+  • Porosité: {db['porosite'][0]*100:.0f} - {db['porosite'][1]*100:.0f}%
+  • Coefficient emmagasinement: {db['storage'][0]:.2e} - {db['storage'][1]:.2e}
+
+Conseil pédagogique:
+  → Utiliser la valeur typique pour les calculs préalables
+  → Tester la sensibilité avec min et max
+  → Affiner avec mesures in situ (Lefranc, Lugeon, Theis)
+            """
+    }
+
+
+# Évaluation partielle à l'import : la base est constante, les
+# recommandations dérivées le sont donc aussi
+ParameterRecommender._LITHOLOGY_CACHE = {
+    name: _build_recommendation(name, db)
+    for name, db in ParameterRecommender.LITHOLOGY_DATABASE.items()
+}
+
+# Vue SoA de la base : colonnes parallèles dans l'ordre de déclaration,
+# bornes normalisées min <= max (les tuples source mélangent les deux sens).
+# Permet de comparer un tableau d'échantillons à toutes les lithologies
+# en une opération, au lieu de déballer dict + tuples par échantillon.
+_DB = ParameterRecommender.LITHOLOGY_DATABASE
+LITHOLOGY_INDEX = {name: i for i, name in enumerate(_DB)}
+DB_NAMES = np.array(list(_DB))
+DB_K_MIN = np.array([min(d['K_ms']) for d in _DB.values()])
+DB_K_MAX = np.array([max(d['K_ms']) for d in _DB.values()])
+DB_POR_MIN = np.array([min(d['porosite']) for d in _DB.values()])
+DB_POR_MAX = np.array([max(d['porosite']) for d in _DB.values()])
+DB_S_MIN = np.array([min(d['storage']) for d in _DB.values()])
+DB_S_MAX = np.array([max(d['storage']) for d in _DB.values()])
+
+
+def validate_k_many(K_ms: np.ndarray, lithology_idx: np.ndarray) -> np.ndarray:
+    """
+    Vérifie en bloc que des K mesurés tombent dans la plage de leur
+    lithologie (indices via LITHOLOGY_INDEX).
+
+    Returns:
+        Tableau booléen : True si K est dans la plage attendue
+    """
+    K_ms = np.asarray(K_ms, dtype=float)
+    lithology_idx = np.asarray(lithology_idx)
+    return (K_ms >= DB_K_MIN[lithology_idx]) & (K_ms <= DB_K_MAX[lithology_idx])
+
+
 def get_lithology_list() -> Dict[str, str]:
     """Retourne liste lithologies disponibles."""
     return {
@@ -11,8 +11,15 @@ import numpy as np
 from typing import Dict, List, Tuple
 import logging
 
+from ._cache import cached_ai
+
 logger = logging.getLogger(__name__)
 
+# Codes de sévérité entiers (source de vérité des validations) et leurs
+# libellés d'affichage : les appelants en lot comparent des entiers,
+# la couche d'affichage traduit
+SEVERITY_LABELS = ('OK', 'ATTENTION', 'BLOQUÉ')
+
 
 class PreComputeValidator:
     """
@@ -27,129 +34,143 @@ class PreComputeValidator:
             'BLOQUÉ': 2
         }
     
-    def validate_theis_parameters(self, Q: float, T: float, S: float, 
-                                  distance: float, time_max: float) -> Dict:
-        """
-        Valide cohérence paramètres essai Theis.
-        
-        Returns:
-            Dict avec status (OK/ATTENTION/BLOQUÉ) et explications
-        """
+    # Tables déclaratives de vérifications : (prédicat, message, sévérité),
+    # sévérité 2 = bloquant, 1 = avertissement. Un seul passage en boucle
+    # par validation, et les plages restent lisibles d'un coup d'œil.
+    _THEIS_CHECKS = (
+        (lambda p: p['Q'] <= 0,
+         lambda p: "❌ Débit Q doit être positif", 2),
+        (lambda p: p['T'] <= 0,
+         lambda p: "❌ Transmissivité T doit être positive", 2),
+        (lambda p: p['S'] <= 0 or p['S'] >= 1,
+         lambda p: "❌ Coefficient emmagasinement S doit être entre 0 et 1", 2),
+        (lambda p: p['distance'] <= 0,
+         lambda p: "❌ Distance r doit être positive", 2),
+        (lambda p: p['T'] > 1e-2,  # T > 10^-2 très haut
+         lambda p: f"⚠ Transmissivité très élevée: T={p['T']:.2e} (atypique)", 1),
+        (lambda p: p['S'] < 1e-6,  # S < 10^-6 très bas
+         lambda p: f"⚠ Emmagasinement très faible: S={p['S']:.2e} (captif profond?)", 1),
+        (lambda p: p['u'] is not None and p['u'] > 10,
+         lambda p: f"⚠ u={p['u']:.2f} >> 1 : temps observation trop court?", 1),
+        (lambda p: p['u'] is not None and p['u'] < 1e-4,
+         lambda p: f"⚠ u={p['u']:.2e} << 1 : temps observation très long", 1),
+        (lambda p: p['Q'] > p['T'] * p['distance'] / 100,  # Heuristique simple
+         lambda p: "⚠ Débit semble élevé pour T donnée", 1),
+    )
+
+    _K_EXPECTED = {
+        'graviers': (1e-2, 1e-3),
+        'sables': (1e-3, 1e-5),
+        'silt': (1e-5, 1e-7),
+        'argile': (1e-7, 1e-9),
+    }
+
+    _GEOLOGY_CHECKS = (
+        (lambda p: p['K'] <= 0 or p['K'] > 1,
+         lambda p: "❌ Conductivité K hors limites (0 < K < 1 m/s)", 2),
+        (lambda p: p['porosity'] <= 0 or p['porosity'] >= 1,
+         lambda p: "❌ Porosité hors limites (0 < φ < 1)", 2),
+        (lambda p: p['S'] <= 0 or p['S'] >= p['porosity'],
+         lambda p: "❌ Coefficient emmagasinement incohérent (0 < S < φ)", 2),
+        (lambda p: p['K_range'] is not None and
+         (p['K'] < p['K_range'][0] or p['K'] > p['K_range'][1]),
+         lambda p: (f"⚠ K={p['K']:.2e} en dehors plage {p['lithology']} "
+                    f"({p['K_range'][0]:.2e}-{p['K_range'][1]:.2e})"), 1),
+        (lambda p: p['S'] / p['porosity'] < 1e-6,
+         lambda p: f"⚠ Aquifère très captif (S/φ={p['S']/p['porosity']:.2e})", 1),
+        (lambda p: p['S'] / p['porosity'] > 0.1,
+         lambda p: f"⚠ Aquifère très libre (S/φ={p['S']/p['porosity']:.2f})", 1),
+    )
+
+    @staticmethod
+    def _run_checks(checks, p):
+        """Évalue une table de vérifications et retourne (issues, warnings)"""
         issues = []
         warnings = []
-        
-        # Vérifications basiques
-        if Q <= 0:
-            issues.append("❌ Débit Q doit être positif")
-        
-        if T <= 0:
-            issues.append("❌ Transmissivité T doit être positive")
-        
-        if S <= 0 or S >= 1:
-            issues.append("❌ Coefficient emmagasinement S doit être entre 0 et 1")
-        
-        if distance <= 0:
-            issues.append("❌ Distance r doit être positive")
-        
-        # Vérifications de plausibilité
-        if T > 1e-2:  # T > 10^-2 très haut
-            warnings.append(f"⚠ Transmissivité très élevée: T={T:.2e} (atypique)")
-        
-        if S < 1e-6:  # S < 10^-6 très bas
-            warnings.append(f"⚠ Emmagasinement très faible: S={S:.2e} (captif profond?)")
-        
-        # Vérifier cohérence T-S : ratio raisonnable?
-        if distance and time_max:
-            u_min = (distance**2 * S) / (4 * T * time_max)
-            
-            if u_min > 10:
-                warnings.append(f"⚠ u={u_min:.2f} >> 1 : temps observation trop court?")
-            elif u_min < 1e-4:
-                warnings.append(f"⚠ u={u_min:.2e} << 1 : temps observation très long")
-        
-        # Débit cohérent avec T?
-        if Q > T * distance / 100:  # Heuristique simple
-            warnings.append(f"⚠ Débit semble élevé pour T donnée")
-        
-        # Résumé
-        if issues:
-            status = 'BLOQUÉ'
-            severity = 2
-        elif warnings:
-            status = 'ATTENTION'
-            severity = 1
-        else:
-            status = 'OK'
-            severity = 0
-        
+        for predicate, message, severity in checks:
+            if predicate(p):
+                (issues if severity == 2 else warnings).append(message(p))
+        return issues, warnings
+
+    @staticmethod
+    def _summarize(issues, warnings) -> Dict:
+        """Résumé standard d'une validation"""
+        # La sévérité entière est la donnée primaire ; le libellé est
+        # une constante interne partagée, pas une chaîne allouée par appel
+        severity = 2 if issues else (1 if warnings else 0)
+
         return {
-            'status': status,
+            'status': SEVERITY_LABELS[severity],
             'severity': severity,
             'issues': issues,
             'warnings': warnings,
             'confidence_score': max(0, 100 - len(issues)*20 - len(warnings)*5),
             'can_proceed': len(issues) == 0
         }
-    
-    def validate_geology_parameters(self, K: float, porosity: float, 
+
+    @cached_ai
+    def validate_theis_parameters(self, Q: float, T: float, S: float,
+                                  distance: float, time_max: float) -> Dict:
+        """
+        Valide cohérence paramètres essai Theis.
+
+        Returns:
+            Dict avec status (OK/ATTENTION/BLOQUÉ) et explications
+        """
+        p = {'Q': Q, 'T': T, 'S': S, 'distance': distance, 'time_max': time_max}
+
+        # Cohérence T-S : ratio raisonnable?
+        if distance and time_max:
+            p['u'] = (distance**2 * S) / (4 * T * time_max)
+        else:
+            p['u'] = None
+
+        issues, warnings = self._run_checks(self._THEIS_CHECKS, p)
+        return self._summarize(issues, warnings)
+
+    def validate_theis_batch(self, Q, T, S, distance, time_max) -> np.ndarray:
+        """
+        Validation Theis vectorisée pour balayages de sensibilité.
+
+        Applique les mêmes seuils que validate_theis_parameters à des
+        tableaux entiers de triplets (Q, T, S) en une passe de masques
+        booléens, sans boucle Python.
+
+        Args:
+            Q, T, S: Tableaux (ou scalaires broadcastés) de paramètres
+            distance, time_max: Géométrie/durée communes au balayage
+
+        Returns:
+            np.ndarray int8 : sévérité par ligne (0=OK, 1=ATTENTION, 2=BLOQUÉ)
+        """
+        Q = np.asarray(Q, dtype=float)
+        T = np.asarray(T, dtype=float)
+        S = np.asarray(S, dtype=float)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            u = (distance * distance * S) / (4 * T * time_max)
+
+        blocked = (Q <= 0) | (T <= 0) | (S <= 0) | (S >= 1) | (distance <= 0)
+        warn = ((T > 1e-2) | (S < 1e-6) | (u > 10) | (u < 1e-4)
+                | (Q > T * distance / 100))
+
+        return np.where(blocked, 2, np.where(warn, 1, 0)).astype(np.int8)
+
+    def validate_geology_parameters(self, K: float, porosity: float,
                                      S: float, lithology: str = '') -> Dict:
         """
         Valide cohérence paramètres géologiques.
         """
-        issues = []
-        warnings = []
-        
-        # Vérifications basiques
-        if K <= 0 or K > 1:
-            issues.append("❌ Conductivité K hors limites (0 < K < 1 m/s)")
-        
-        if porosity <= 0 or porosity >= 1:
-            issues.append("❌ Porosité hors limites (0 < φ < 1)")
-        
-        if S <= 0 or S >= porosity:
-            issues.append("❌ Coefficient emmagasinement incohérent (0 < S < φ)")
-        
-        # Cohérences K-lithologie
-        if lithology:
-            K_expected = {
-                'graviers': (1e-2, 1e-3),
-                'sables': (1e-3, 1e-5),
-                'silt': (1e-5, 1e-7),
-                'argile': (1e-7, 1e-9),
-            }
-            
-            if lithology in K_expected:
-                K_min, K_max = K_expected[lithology]
-                if K < K_min or K > K_max:
-                    warnings.append(
-                        f"⚠ K={K:.2e} en dehors plage {lithology} "
-                        f"({K_min:.2e}-{K_max:.2e})"
-                    )
-        
-        # Cohérence S-porosité pour aquifère captif
-        if S / porosity < 1e-6:
-            warnings.append(f"⚠ Aquifère très captif (S/φ={S/porosity:.2e})")
-        elif S / porosity > 0.1:
-            warnings.append(f"⚠ Aquifère très libre (S/φ={S/porosity:.2f})")
-        
-        if issues:
-            status = 'BLOQUÉ'
-            severity = 2
-        elif warnings:
-            status = 'ATTENTION'
-            severity = 1
-        else:
-            status = 'OK'
-            severity = 0
-        
-        return {
-            'status': status,
-            'severity': severity,
-            'issues': issues,
-            'warnings': warnings,
-            'confidence_score': max(0, 100 - len(issues)*20 - len(warnings)*5),
-            'can_proceed': len(issues) == 0
+        p = {
+            'K': K,
+            'porosity': porosity,
+            'S': S,
+            'lithology': lithology,
+            'K_range': self._K_EXPECTED.get(lithology) if lithology else None,
         }
+
+        issues, warnings = self._run_checks(self._GEOLOGY_CHECKS, p)
+        return self._summarize(issues, warnings)
     
     def validate_boundary_conditions(self, BCs: Dict) -> Dict:
         """
@@ -164,27 +185,24 @@ class PreComputeValidator:
         if not BCs:
             issues.append("❌ Aucune condition aux limites définie")
         
-        # Vérifier au moins 1 Dirichlet ou Neumann par bord
-        bc_types = [bc.get('type', '') for bc in BCs.values()]
-        
-        if not any('Dirichlet' in t or 'Neumann' in t for t in bc_types):
-            issues.append("❌ Au moins une condition Dirichlet ou Neumann requise")
-        
-        # Vérifier cohérence valeurs
+        # Passe unique : présence Dirichlet/Neumann + cohérence des valeurs
+        has_main_bc = False
         for loc, bc in BCs.items():
+            bc_type = bc.get('type', '')
+            if 'Dirichlet' in bc_type or 'Neumann' in bc_type:
+                has_main_bc = True
             val = bc.get('value', 0)
-            if bc.get('type') == 'Neumann' and abs(val) > 1:  # Heuristique
+            if bc_type == 'Neumann' and abs(val) > 1:  # Heuristique
                 warnings.append(f"⚠ Flux Neumann {val} très élevé en {loc}")
-        
-        if issues:
-            status = 'BLOQUÉ'
-        elif warnings:
-            status = 'ATTENTION'
-        else:
-            status = 'OK'
-        
+
+        if not has_main_bc:
+            issues.append("❌ Au moins une condition Dirichlet ou Neumann requise")
+
+        severity = 2 if issues else (1 if warnings else 0)
+
         return {
-            'status': status,
+            'status': SEVERITY_LABELS[severity],
+            'severity': severity,
             'issues': issues,
             'warnings': warnings,
             'can_proceed': len(issues) == 0
@@ -0,0 +1,71 @@
+"""
+Utilitaires tableaux partagés par les modules de calcul.
+"""
+
+import weakref
+
+import numpy as np
+
+
+def _as_f64(a) -> np.ndarray:
+    """
+    Convertit en float64 contigu sans copier une entrée déjà conforme.
+
+    Les chargeurs de données passent en général des float64 contigus :
+    dans ce cas le tableau est renvoyé tel quel, sans l'allocation ni la
+    recopie complète que provoque une conversion systématique.
+    """
+    if isinstance(a, np.ndarray) and a.dtype == np.float64 and a.flags.c_contiguous:
+        return a
+    return np.ascontiguousarray(a, dtype=np.float64)
+
+
+class TimeContext:
+    """
+    Prétraitements partagés d'un axe de temps.
+
+    log(t), 1/t et 1/(4t) sont calculés une fois et réutilisables par
+    plusieurs analyses (Theis, Cooper-Jacob) portant sur les mêmes temps,
+    au lieu d'être refaits par chacune dans ses boucles internes.
+    """
+
+    __slots__ = ('t', 'log_t', 'inv_t', 'inv_4t')
+
+    def __init__(self, times):
+        self.t = _as_f64(times)
+        self.log_t = np.log(self.t)
+        self.inv_t = 1.0 / self.t
+        self.inv_4t = 0.25 * self.inv_t
+
+
+# Caches log/log10 par identité de tableau : un curseur UI qui redessine
+# avec le même axe de temps ne repaie pas le log de la série à chaque
+# appel. Les entrées sont purgées quand le tableau source meurt.
+_LOG10_CACHE = {}
+_LOG_CACHE = {}
+
+
+def _cached_ufunc(arr, ufunc, cache) -> np.ndarray:
+    key = id(arr)
+    entry = cache.get(key)
+    if entry is not None and entry[0]() is arr:
+        return entry[1]
+
+    result = ufunc(arr)
+    try:
+        ref = weakref.ref(arr, lambda _, k=key, c=cache: c.pop(k, None))
+    except TypeError:
+        # Entrée non référençable faiblement (liste...) : pas de cache
+        return result
+    cache[key] = (ref, result)
+    return result
+
+
+def _cached_log10(arr) -> np.ndarray:
+    """log10 mémoïsé par identité (mêmes données -> même résultat en cache)."""
+    return _cached_ufunc(arr, np.log10, _LOG10_CACHE)
+
+
+def _cached_log(arr) -> np.ndarray:
+    """log naturel mémoïsé par identité."""
+    return _cached_ufunc(arr, np.log, _LOG_CACHE)
@@ -0,0 +1,59 @@
+"""
+Exponentielle intégrale E1 compilée (numba optionnel)
+=====================================================
+
+`scipy.special.exp1` repasse la frontière Python→C à chaque appel ; dans
+la boucle interne d'un optimiseur cela domine le coût de la courbe Theis.
+Ce module fournit un noyau numba (approximation rationnelle classique de
+E1, du type Cody & Thacher 1968 — coefficients d'Abramowitz & Stegun
+5.1.53/5.1.56, erreur < 2e-7) parallélisé sur les points, avec repli
+transparent sur scipy quand numba est absent.
+"""
+
+import os
+
+import numpy as np
+from scipy.special import exp1 as _scipy_exp1
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _exp1_scalar(x):
+        """E1(x) pour x > 0 par approximation rationnelle (deux branches)."""
+        if x <= 1.0:
+            # E1(x) = -ln(x) + P(x), |err| < 2e-7 (A&S 5.1.53)
+            return (-np.log(x) - 0.57721566
+                    + x * (0.99999193
+                           + x * (-0.24991055
+                                  + x * (0.05519968
+                                         + x * (-0.00976004
+                                                + x * 0.00107857)))))
+        # x·eˣ·E1(x) = P2(x)/Q2(x), |err| < 2e-8 (A&S 5.1.56)
+        num = (x * (x * (x * (x + 8.5733287401) + 18.0590169730)
+                    + 8.6347608925) + 0.2677737343)
+        den = (x * (x * (x * (x + 9.5733223454) + 25.6329561486)
+                    + 21.0996530827) + 3.9584969228)
+        return np.exp(-x) / x * (num / den)
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def exp1_into(x, out):
+        """E1 élément par élément, écrit dans `out` (pas d'allocation)."""
+        for i in prange(x.size):
+            out[i] = _exp1_scalar(x[i])
+        return out
+else:
+    def exp1_into(x, out):
+        """E1 élément par élément, écrit dans `out` (ufunc scipy)."""
+        return _scipy_exp1(x, out)
+
+
+# Préchauffage optionnel : même mécanisme que core/calculations/piezo.py,
+# activé par l'application GUI via HYDROAPP_PRECOMPILE_NUMBA=1
+if HAS_NUMBA and os.environ.get('HYDROAPP_PRECOMPILE_NUMBA'):
+    exp1_into(np.array([0.5, 2.0]), np.empty(2))
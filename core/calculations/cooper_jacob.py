@@ -12,13 +12,18 @@ Références:
   evaluating formation constants and summarizing well-field history"
 """
 
+import functools
+
 import numpy as np
-from scipy.optimize import curve_fit, linear_sum_assignment
 from typing import Tuple, Dict, Optional
 import logging
 
+from ._arrays import TimeContext, _as_f64, _cached_log, _cached_log10
+
 logger = logging.getLogger(__name__)
 
+_LN10 = np.log(10)
+
 
 class CooperJacobAnalysis:
     """
@@ -30,30 +35,47 @@ class CooperJacobAnalysis:
     Équation : s ≈ (Q / 4πT) * [ln(2.25*T*t / (r²*S))]
               = (Q / 4πT) * ln(t) + cte
     """
-    
-    def __init__(self, Q: float, distance: float, times: np.ndarray, drawdowns: np.ndarray):
+
+    # Attributs figés : pas de __dict__ par instance (cf. TheisAnalysis)
+    __slots__ = ('Q', 'distance', '_time_ctx', 'times', 'drawdowns',
+                 'T', 'S', 'slope_ln', 'intercept', 't0', 'rmse',
+                 'validity_range', '_u_factor', 'residuals')
+
+    def __init__(self, Q: float, distance: float, times: np.ndarray, drawdowns: np.ndarray,
+                 time_ctx: Optional[TimeContext] = None):
         """
         Initialise l'analyse Cooper-Jacob.
-        
+
         Args:
             Q (float): Débit de pompage (m³/s)
             distance (float): Distance puits-piézomètre (m)
             times (np.ndarray): Temps (s)
             drawdowns (np.ndarray): Rabattements (m)
+            time_ctx (TimeContext, optional): Prétraitements de l'axe de
+                temps partagés avec une autre analyse sur les mêmes temps
         """
         self.Q = Q
         self.distance = distance
-        self.times = np.asarray(times, dtype=float)
-        self.drawdowns = np.asarray(drawdowns, dtype=float)
+        self._time_ctx = time_ctx
+        self.times = time_ctx.t if time_ctx is not None else _as_f64(times)
+        self.drawdowns = _as_f64(drawdowns)
         
         self.T = None
         self.S = None
-        self.slope = None  # Pente de la droite (Δs / Δlog(t))
+        self.slope_ln = None  # Pente en log naturel (Δs / Δln(t))
         self.intercept = None
         self.t0 = None  # Temps d'intersection (s = 0)
         self.rmse = None
         self.validity_range = None  # (t_min, t_max) pour u < 0.05
-        
+        self._u_factor = None  # r²S/(4T), fixé par fit_linear
+
+    @property
+    def slope(self):
+        """Pente en log10 (Δs / Δlog₁₀(t)), forme historique de l'API."""
+        if self.slope_ln is None:
+            return None
+        return self.slope_ln * _LN10
+
     def cooper_jacob_linear(self, log10_t: np.ndarray, slope: float, intercept: float) -> np.ndarray:
         """
         Fonction linéaire en log10(t).
@@ -74,14 +96,26 @@ class CooperJacobAnalysis:
             Dict avec T, S, rmse, parameters
         """
         
-        # Ajustement linéaire : s = slope * log10(t) + intercept
-        log10_t = np.log10(self.times)
-        
-        # Fit linéaire
+        # Ajustement linéaire en log naturel : s = slope_ln * ln(t) + icpt
+        # (même régression, np.log évite les conversions ln(10) internes ;
+        # ln(t) vient du contexte partagé quand il existe, sinon du cache
+        # par identité : mêmes temps, un seul calcul)
+        if self._time_ctx is not None:
+            log_t = self._time_ctx.log_t
+        else:
+            log_t = _cached_log(self.times)
+
+        # Fit linéaire par équations normales : pour un degré 1, quatre
+        # sommes suffisent (polyfit monte une SVD complète pour le même
+        # résultat)
         try:
-            coeffs = np.polyfit(log10_t, self.drawdowns, 1)
-            self.slope = coeffs[0]  # Δs / Δlog10(t)
-            self.intercept = coeffs[1]
+            n = len(log_t)
+            Sx = log_t.sum()
+            Sxx = (log_t * log_t).sum()
+            Sy = self.drawdowns.sum()
+            Sxy = (log_t * self.drawdowns).sum()
+            self.slope_ln = (n * Sxy - Sx * Sy) / (n * Sxx - Sx * Sx)  # Δs / Δln(t)
+            self.intercept = (Sy - self.slope_ln * Sx) / n
         except Exception as e:
             logger.error(f"Erreur lors du fit linéaire: {e}")
             return {'success': False, 'error': str(e)}
@@ -94,26 +128,42 @@ class CooperJacobAnalysis:
         self.T = self.Q / (4 * np.pi * self.slope * np.log(10))
         
         # Calcul du temps d'intersection (s = 0)
-        # 0 = slope * log10(t0) + intercept
-        # log10(t0) = -intercept / slope
-        log10_t0 = -self.intercept / self.slope
-        self.t0 = 10 ** log10_t0
+        # 0 = slope_ln * ln(t0) + intercept
+        # ln(t0) = -intercept / slope_ln
+        self.t0 = np.exp(-self.intercept / self.slope_ln)
         
         # Calcul de S : S = 2.25 * T * t0 / r²
         self.S = (2.25 * self.T * self.t0) / (self.distance ** 2)
         
         # Validation : vérifier que u < 0.05 pour au moins 50% des points
-        u_values = (self.distance**2 * self.S) / (4 * self.T * self.times)
-        valid_points = np.sum(u_values < 0.05)
-        validity = valid_points / len(self.times)
-        
-        self.validity_range = (np.min(self.times[u_values < 0.05]),
-                               np.max(self.times[u_values < 0.05]))
-        
-        # Résidus
-        s_calc = self.cooper_jacob_linear(log10_t, self.slope, self.intercept)
-        self.residuals = self.drawdowns - s_calc
-        self.rmse = np.sqrt(np.mean(self.residuals**2))
+        # (inverse des temps calculé une fois, masque réutilisé pour le
+        # comptage et la plage de validité)
+        # Constante r²S/(4T) calculée une fois, réutilisée par
+        # generate_curve à chaque redessin de courbe
+        self._u_factor = (self.distance**2 * self.S) / (4 * self.T)
+        if self._time_ctx is not None:
+            inv_t = self._time_ctx.inv_t
+        else:
+            inv_t = 1.0 / self.times
+        u_values = self._u_factor * inv_t
+        valid_mask = u_values < 0.05
+        valid_count = int(valid_mask.sum())
+        validity = valid_count / n
+
+        # Les temps d'un essai de pompage sont croissants : premier/dernier
+        # point valide par argmax sur le masque, sans extraire le
+        # sous-tableau self.times[mask]
+        if valid_count:
+            first = valid_mask.argmax()
+            last = len(valid_mask) - 1 - valid_mask[::-1].argmax()
+            self.validity_range = (self.times[first], self.times[last])
+        else:
+            self.validity_range = None
+
+        # Résidus : expression directe, log_t déjà en main
+        resid = self.drawdowns - (self.slope_ln * log_t + self.intercept)
+        self.residuals = resid
+        self.rmse = np.sqrt((resid * resid).mean())
         
         logger.info(f"Cooper-Jacob: T={self.T:.2e} m²/s, S={self.S:.2e}, "
                     f"RMSE={self.rmse:.4f} m, validity={validity*100:.1f}%")
@@ -132,13 +182,16 @@ class CooperJacobAnalysis:
     
     def generate_curve(self, t_range: np.ndarray) -> Dict:
         """Génère la courbe Cooper-Jacob pour une plage de temps."""
-        if self.slope is None:
+        if self.slope_ln is None:
             raise ValueError("Fit linéaire non effectué. Appelez fit_linear() d'abord.")
-        
-        log10_t = np.log10(t_range)
-        s = self.cooper_jacob_linear(log10_t, self.slope, self.intercept)
-        
-        u_values = (self.distance**2 * self.S) / (4 * self.T * t_range)
+
+        # Expression directe : une passe pour s, une division pour u
+        # (constante r²S/(4T) mise en cache par fit_linear). log10 dérivé
+        # du log naturel par simple mise à l'échelle.
+        log_t = _cached_log(t_range)
+        s = self.slope_ln * log_t + self.intercept
+        log10_t = log_t * (1.0 / _LN10)
+        u_values = self._u_factor / t_range
         
         return {
             'time': t_range,
@@ -154,7 +207,13 @@ class CooperJacobAnalysis:
         """Résumé texte des résultats."""
         if self.T is None:
             return "Analyse non effectuée"
-        
+
+        if self.validity_range is not None:
+            validity = (f"{self.validity_range[0]:.2e} - "
+                        f"{self.validity_range[1]:.2e} s")
+        else:
+            validity = "aucun point avec u < 0.05"
+
         return f"""
 Résultats Cooper-Jacob
 ======================
@@ -165,18 +224,76 @@ Coefficient emmagasinement: {self.S:.2e}
 Pente (Δs/Δlog₁₀t):        {self.slope:.4f} m
 Temps d'intersection (t₀): {self.t0:.2e} s
 RMSE:                      {self.rmse:.4f} m
-Validité (u<0.05):         {self.validity_range[0]:.2e} - {self.validity_range[1]:.2e} s
+Validité (u<0.05):         {validity}
         """
 
 
-def cooper_jacob_drawdown(Q: float, T: float, S: float, distance: float, time: float) -> float:
+@functools.lru_cache(maxsize=4096)
+def _cooper_jacob_drawdown_scalar(Q: float, T: float, S: float,
+                                  distance: float, time: float) -> float:
+    """Rabattement scalaire mémoïsé (balayages qui répètent les mêmes points)."""
+    term = (2.25 * T * time) / (distance**2 * S)
+    return (Q / (4 * np.pi * T)) * np.log(term)
+
+
+def cooper_jacob_drawdown(Q: float, T: float, S: float, distance: float, time) -> float:
     """
     Approximation semi-log pour le rabattement.
-    
+
     s ≈ (Q / 4πT) * ln(2.25*T*t / (r²*S))
+
+    Accepte un temps scalaire (mémoïsé via lru_cache) ou un tableau de
+    temps (un seul log numpy sur tout le tableau, constantes factorisées).
     """
-    term = (2.25 * T * time) / (distance**2 * S)
-    return (Q / (4 * np.pi * T)) * np.log(term)
+    if np.ndim(time) == 0:
+        return _cooper_jacob_drawdown_scalar(Q, T, S, distance, float(time))
+
+    time = _as_f64(time)
+    factor = (2.25 * T) / (distance**2 * S)
+    return (Q / (4 * np.pi * T)) * np.log(factor * time)
+
+
+def cooper_jacob_batch(Q, distances: np.ndarray, times: np.ndarray,
+                       drawdowns_2d: np.ndarray) -> Dict:
+    """
+    Ajustement Cooper-Jacob simultané de plusieurs puits.
+
+    Une seule décomposition de np.polyfit traite toutes les colonnes
+    (drawdowns_2d en (n_puits, n_temps), temps partagés), puis T et S
+    sortent en opérations vectorielles — au lieu d'une instance
+    CooperJacobAnalysis et d'un fit par puits.
+
+    Args:
+        Q: Débit (m³/s), scalaire ou tableau (n_puits,)
+        distances: Distances puits-piézomètre (m), tableau (n_puits,)
+        times: Temps partagés (s), tableau (n_temps,)
+        drawdowns_2d: Rabattements (m), tableau (n_puits, n_temps)
+
+    Returns:
+        Dict avec T, S, slope, intercept, t0 (tableaux (n_puits,))
+    """
+    distances = _as_f64(distances)
+    drawdowns_2d = np.atleast_2d(_as_f64(drawdowns_2d))
+
+    log10_t = np.log10(_as_f64(times))
+    # polyfit accepte un y 2D (une colonne par puits) : un seul lstsq
+    coeffs = np.polyfit(log10_t, drawdowns_2d.T, 1)
+    slopes, intercepts = coeffs[0], coeffs[1]
+
+    # Mêmes formules que fit_linear, vectorisées sur les puits
+    T = Q / (4 * np.pi * slopes * np.log(10))
+    t0 = 10.0 ** (-intercepts / slopes)
+    S = (2.25 * T * t0) / distances**2
+
+    return {
+        'T': T,
+        'S': S,
+        'slope': slopes,
+        'intercept': intercepts,
+        't0': t0,
+        'n_wells': len(slopes),
+        'success': True
+    }
 
 
 def estimate_transmissivity_cooper_jacob(Q: float, distance: float, times: np.ndarray,
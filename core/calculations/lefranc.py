@@ -17,10 +17,12 @@ References:
 """
 
 import numpy as np
-from scipy.optimize import curve_fit
+from scipy.optimize import least_squares
 from typing import Tuple, Dict, Optional
 import logging
 
+from ._arrays import _as_f64
+
 logger = logging.getLogger(__name__)
 
 
@@ -58,7 +60,33 @@ class LeffrancTest:
             tau = constante de temps
         """
         return h_infty + (h0 - h_infty) * np.exp(-t / tau)
-    
+
+    @staticmethod
+    def _exponential_jacobian(t: np.ndarray, h0: float, h_infty: float,
+                              tau: float) -> np.ndarray:
+        """
+        Jacobien analytique du modèle exponentiel (colonnes ∂h/∂h0,
+        ∂h/∂h_infty, ∂h/∂tau). Évite à curve_fit trois évaluations du
+        modèle par itération en différences finies.
+        """
+        e = np.exp(-t / tau)
+        return np.column_stack((e, 1.0 - e, (h0 - h_infty) * t * e / tau**2))
+
+    def _initial_guess(self, aquifer_head: float):
+        """
+        Point de départ par linéarisation : ln(h - h_infty) est affine en t,
+        un fit degré 1 donne tau et h0 quasi exacts, le fit non linéaire ne
+        fait plus que raffiner.
+        """
+        y = self.heads - aquifer_head
+        mask = y > 1e-12
+        if mask.sum() >= 2:
+            slope, icpt = np.polyfit(self.times[mask], np.log(y[mask]), 1)
+            if slope < 0:
+                return [np.exp(icpt) + aquifer_head, aquifer_head, -1.0 / slope]
+        # Données non exploitables en log (remontée, bruit) : repli heuristique
+        return [self.heads[0], aquifer_head, self.times[-1] / 10]
+
     def fit_exponential(self, times: np.ndarray, heads: np.ndarray,
                         aquifer_head: Optional[float] = None) -> Dict:
         """
@@ -72,23 +100,26 @@ class LeffrancTest:
         Returns:
             Dict avec K, tau, rmse
         """
-        self.times = np.asarray(times, dtype=float)
-        self.heads = np.asarray(heads, dtype=float)
+        self.times = _as_f64(times)
+        self.heads = _as_f64(heads)
         
         # Auto-détection charge stationnaire = dernière mesure
         if aquifer_head is None:
             aquifer_head = self.heads[-1]
         
-        # Fit exponentiel
+        # Fit exponentiel : least_squares direct (Levenberg-Marquardt, sans
+        # la couche d'emballage de curve_fit), jacobien analytique
         try:
-            params, _ = curve_fit(
-                self._exponential_decay,
-                self.times,
-                self.heads,
-                p0=[self.heads[0], aquifer_head, self.times[-1] / 10],
-                maxfev=2000
+            result = least_squares(
+                lambda p: self._exponential_decay(self.times, *p) - self.heads,
+                x0=self._initial_guess(aquifer_head),
+                jac=lambda p: self._exponential_jacobian(self.times, *p),
+                method='lm',
+                max_nfev=2000
             )
-            h0, h_infty, tau = params
+            if not result.success:
+                raise RuntimeError(result.message)
+            h0, h_infty, tau = result.x
         except Exception as e:
             logger.error(f"Fit exponentiel échoué: {e}")
             return {'success': False, 'error': str(e)}
@@ -109,10 +140,12 @@ class LeffrancTest:
             L = 1.0  # Distance entre packers
             self.K = r_screen / (2 * tau * L)
         
-        # Résidus
+        # Résidus : h_calc sert de tampon (écarts puis carrés en place),
+        # aucun tableau intermédiaire supplémentaire
         h_calc = self._exponential_decay(self.times, h0, h_infty, tau)
-        residuals = self.heads - h_calc
-        rmse = np.sqrt(np.mean(residuals**2))
+        np.subtract(self.heads, h_calc, out=h_calc)
+        np.square(h_calc, out=h_calc)
+        rmse = np.sqrt(h_calc.mean())
         
         logger.info(f"Lefranc: K={self.K:.2e} m/s, tau={tau:.2f} s, RMSE={rmse:.4f} m")
         
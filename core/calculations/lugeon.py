@@ -18,8 +18,20 @@ import numpy as np
 from typing import Dict, Tuple, Optional
 import logging
 
+from ._arrays import _as_f64
+
 logger = logging.getLogger(__name__)
 
+# Table de qualité par coefficient de variation : side='right' reproduit
+# les comparaisons strictes `cv < seuil`
+_QUALITY_THRESHOLDS = np.array([0.15, 0.30, 0.50])
+_QUALITY_LABELS = (
+    "Excellent - Très reproductible",
+    "Bon - Reproductible",
+    "Moyen - Acceptable",
+    "Mauvais - Trop variable (vérifier le test)",
+)
+
 
 class LugeonTest:
     """
@@ -41,97 +53,161 @@ class LugeonTest:
             test_length (float): Longueur du tronçon testé (m)
         """
         self.test_length = test_length
-        self.pressure_steps = []  # Pressions (bar)
-        self.discharge_rates = []  # Débits (L/min)
-        self.lugeon_values = []  # Lugeons (UL)
-        self.K_values = []  # K (m/s)
+        # Stockage en colonnes numpy contiguës (capacité doublée au besoin) :
+        # les calculs Lugeon/K et les moyennes se font en opérations
+        # vectorielles au lieu de listes Python parcourues mesure par mesure
+        self._capacity = 8
+        self._count = 0
+        self._pressures = np.empty(self._capacity)
+        self._discharges = np.empty(self._capacity)
+        self._lugeons = np.empty(self._capacity)
+        self._K = np.empty(self._capacity)
+        self._mean_result = None  # Cache compute_mean_k, invalidé à l'ajout
+        self._summary_cache = None  # Texte get_summary, invalidé à l'ajout
         self.K_mean = None
         self.K_unit = 'm/s'
-        
+
+    # Vues publiques (tronquées à la partie remplie du tampon)
+    @property
+    def pressure_steps(self) -> np.ndarray:
+        return self._pressures[:self._count]
+
+    @property
+    def discharge_rates(self) -> np.ndarray:
+        return self._discharges[:self._count]
+
+    @property
+    def lugeon_values(self) -> np.ndarray:
+        return self._lugeons[:self._count]
+
+    @property
+    def K_values(self) -> np.ndarray:
+        return self._K[:self._count]
+
+    def _ensure_capacity(self, extra: int):
+        """Agrandit les tampons (doublement) si `extra` mesures ne tiennent pas."""
+        needed = self._count + extra
+        if needed <= self._capacity:
+            return
+        while self._capacity < needed:
+            self._capacity *= 2
+        for name in ('_pressures', '_discharges', '_lugeons', '_K'):
+            buf = np.empty(self._capacity)
+            buf[:self._count] = getattr(self, name)[:self._count]
+            setattr(self, name, buf)
+
     def add_measurement(self, pressure_bar: float, discharge_lpm: float):
         """
         Ajoute une mesure de débit à une pression donnée.
-        
+
         Args:
             pressure_bar (float): Pression (bar)
             discharge_lpm (float): Débit (L/min)
         """
-        self.pressure_steps.append(pressure_bar)
-        self.discharge_rates.append(discharge_lpm)
-        
+        self.add_measurements([pressure_bar], [discharge_lpm])
+
+        logger.debug(f"Lugeon: P={pressure_bar} bar, Q={discharge_lpm} L/min, "
+                     f"UL={self._lugeons[self._count-1]:.2f}, "
+                     f"K={self._K[self._count-1]:.2e} m/s")
+
+    def add_measurements(self, pressures_bar: np.ndarray,
+                         discharges_lpm: np.ndarray):
+        """
+        Ajoute un lot de mesures en une passe vectorielle.
+
+        Args:
+            pressures_bar: Pressions (bar)
+            discharges_lpm: Débits (L/min)
+        """
+        p = _as_f64(pressures_bar)
+        q = _as_f64(discharges_lpm)
+
         # Calcul Lugeon : UL = (Q_lpm / L_m) * (10 / P_bar)
         # Ramené à 10 bar pour normalisation
-        lugeon = (discharge_lpm / self.test_length) * (10.0 / pressure_bar)
-        self.lugeon_values.append(lugeon)
-        
+        lugeon = (q / self.test_length) * (10.0 / p)
         # Conversion m/s : K = UL * 10^-7
         K_ms = lugeon * self.LUGEON_TO_MS
-        self.K_values.append(K_ms)
-        
-        logger.debug(f"Lugeon: P={pressure_bar} bar, Q={discharge_lpm} L/min, "
-                     f"UL={lugeon:.2f}, K={K_ms:.2e} m/s")
-    
+
+        self._ensure_capacity(len(p))
+        i, j = self._count, self._count + len(p)
+        self._pressures[i:j] = p
+        self._discharges[i:j] = q
+        self._lugeons[i:j] = lugeon
+        self._K[i:j] = K_ms
+        self._count = j
+        self._mean_result = None
+        self._summary_cache = None
+
     def compute_mean_k(self) -> Dict:
         """
         Calcule perméabilité moyenne (typiquement palier 10 bar).
-        
+
         Returns:
             Dict avec K_mean, lugeon_mean, rmse_variation
         """
-        if not self.K_values:
+        if self._count == 0:
             raise ValueError("Aucune mesure effectuée")
-        
+
+        # Résultat mis en cache : quality/summary/export le redemandent
+        # sans que les données aient changé
+        if self._mean_result is not None:
+            return dict(self._mean_result)
+
+        pressures = self.pressure_steps
+        K_values = self.K_values
+        lugeons = self.lugeon_values
+
         # Filtrer mesures à 10 bar
-        idx_10bar = [i for i, p in enumerate(self.pressure_steps) if abs(p - 10.0) < 1.0]
-        
-        if idx_10bar:
+        mask_10bar = np.abs(pressures - 10.0) < 1.0
+
+        if mask_10bar.any():
             # Moyenne à 10 bar (plus fiable)
-            self.K_mean = np.mean([self.K_values[i] for i in idx_10bar])
-            lugeon_mean = np.mean([self.lugeon_values[i] for i in idx_10bar])
+            self.K_mean = K_values[mask_10bar].mean()
+            lugeon_mean = lugeons[mask_10bar].mean()
         else:
             # Sinon moyenne globale (moins fiable)
-            self.K_mean = np.mean(self.K_values)
-            lugeon_mean = np.mean(self.lugeon_values)
-        
+            self.K_mean = K_values.mean()
+            lugeon_mean = lugeons.mean()
+
         # Variation (indicateur de qualité du test)
-        std_K = np.std(self.K_values)
+        std_K = K_values.std()
         cv = std_K / self.K_mean if self.K_mean > 0 else 0  # Coefficient de variation
-        
-        return {
+
+        self._mean_result = {
             'K_mean': self.K_mean,
             'K_unit': 'm/s',
             'lugeon_mean': lugeon_mean,
             'std_K': std_K,
             'cv': cv,  # Coefficient de variation
-            'num_steps': len(self.K_values),
+            'num_steps': self._count,
             'success': True
         }
-    
+        return dict(self._mean_result)
+
     def get_quality_assessment(self) -> str:
         """Évalue la qualité du test."""
-        if not self.K_values:
+        if self._count == 0:
             return "Aucune donnée"
-        
+
         result = self.compute_mean_k()
         cv = result['cv']
-        
-        if cv < 0.15:
-            return "Excellent - Très reproductible"
-        elif cv < 0.30:
-            return "Bon - Reproductible"
-        elif cv < 0.50:
-            return "Moyen - Acceptable"
-        else:
-            return "Mauvais - Trop variable (vérifier le test)"
+
+        return _QUALITY_LABELS[
+            np.searchsorted(_QUALITY_THRESHOLDS, cv, side='right')]
     
     def get_summary(self) -> str:
         """Résumé texte complet."""
-        if not self.K_values:
+        if self._count == 0:
             return "Test non effectué"
-        
+
+        # Texte reconstruit seulement après un ajout de mesures : les
+        # rafraîchissements UI répétés relisent le cache
+        if self._summary_cache is not None:
+            return self._summary_cache
+
         result = self.compute_mean_k()
-        
-        return f"""
+
+        self._summary_cache = f"""
 Résultats Test Lugeon
 ====================
 Longueur du tronçon (L): {self.test_length:.2f} m
@@ -146,6 +222,7 @@ Détail par palier:
 """+ "\n".join([f"  P={p:.0f} bar: Q={q:.1f} L/min, UL={ul:.2f}, K={k:.2e} m/s"
               for p, q, ul, k in zip(self.pressure_steps, self.discharge_rates,
                                       self.lugeon_values, self.K_values)])
+        return self._summary_cache
     
     def export_results(self) -> Dict:
         """Exporte résultats complets."""
@@ -6,20 +6,76 @@ Outils pour analyse des niveaux piézométriques, tendances, variations saisonni
 et interprétations hydrogéologiques standard.
 """
 
+import os
+
 import numpy as np
 from scipy import stats
 from datetime import datetime, timedelta
 from typing import Dict, Tuple, Optional, List
 import logging
 
+from ._arrays import _as_f64, _cached_log10
+
 logger = logging.getLogger(__name__)
 
+# Numba optionnel : accélère les passes fusionnées sur longues séries,
+# sinon repli numpy équivalent
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _piezo_stats(x):
+        """Min/max/somme/somme des carrés en une seule traversée."""
+        mn = x[0]
+        mx = x[0]
+        s = 0.0
+        s2 = 0.0
+        for v in x:
+            if v < mn:
+                mn = v
+            if v > mx:
+                mx = v
+            s += v
+            s2 += v * v
+        return mn, mx, s, s2
+else:
+    def _piezo_stats(x):
+        """Min/max/somme/somme des carrés (réductions numpy)."""
+        return x.min(), x.max(), x.sum(), (x * x).sum()
+
+
+# Tables de classification : searchsorted remplace les cascades if/elif
+# et s'applique aussi bien à un scalaire qu'à un lot de puits.
+# side='left' reproduit les comparaisons strictes `valeur > seuil`.
+_BEHAVIOR_THRESHOLDS = np.array([0.3, 1.0])
+_BEHAVIOR_LABELS = (
+    "Faible amplitude - Aquifère captif / profond",
+    "Amplitude modérée - Aquifère captif/libre",
+    "Fort amplitude - Aquifère libre / semi-libre",
+)
+_REACTIVITY_THRESHOLDS = np.array([0.05, 0.1])
+_REACTIVITY_LABELS = (
+    "Peu réactif - Aquifère profond/captif",
+    "Réactif - Aquifère peu profond",
+    "Très réactif - Aquifère proche surface",
+)
+
 
 class PiezoAnalysis:
     """
     Analyse complète de données piézométriques.
     """
-    
+
+    # Attributs figés : pas de __dict__ par instance — les tableaux de
+    # bord instancient une analyse par piézomètre affiché
+    __slots__ = ('dates', '_dates64', '_t_days', 'levels', 'n_points',
+                 'min_level', 'max_level', 'mean_level', 'std_level',
+                 'amplitude', '_stats', '_trend', '_aquifer')
+
     def __init__(self, dates: List[datetime], levels: np.ndarray):
         """
         Args:
@@ -27,27 +83,54 @@ class PiezoAnalysis:
             levels (np.ndarray): Niveaux piézométriques (m NGF ou relatif)
         """
         self.dates = dates
-        self.levels = np.asarray(levels, dtype=float)
+        # Dates en datetime64 : la conversion en jours écoulés devient une
+        # soustraction vectorielle au lieu d'une boucle sur des datetime
+        self._dates64 = np.asarray(dates, dtype='datetime64[s]')
+        self._t_days = None  # Jours écoulés, calculés à la demande
+        self.levels = _as_f64(levels)
         self.n_points = len(self.levels)
-        
-        # Calcul de paramètres basiques
-        self.min_level = np.min(self.levels)
-        self.max_level = np.max(self.levels)
-        self.mean_level = np.mean(self.levels)
-        self.std_level = np.std(self.levels)
+
+        # Calcul de paramètres basiques : une passe fusionnée fournit
+        # min/max/somme/somme², moyenne et écart-type s'en déduisent
+        mn, mx, s, s2 = _piezo_stats(self.levels)
+        self.min_level = mn
+        self.max_level = mx
+        self.mean_level = s / self.n_points
+        self.std_level = np.sqrt(max(s2 / self.n_points - self.mean_level**2, 0.0))
         self.amplitude = self.max_level - self.min_level
-        
+        # Caches d'analyse : une régression / classification par jeu de
+        # données, réutilisée entre résumé et tracés
+        self._stats = None
+        self._trend = None
+        self._aquifer = None
+
+    def clear_cache(self):
+        """Invalide les résultats mémoïsés après modification des données."""
+        self._t_days = None
+        self._stats = None
+        self._trend = None
+        self._aquifer = None
+
+    def _elapsed_days(self) -> np.ndarray:
+        """Jours écoulés depuis la première mesure (float64, vectorisé)."""
+        if self._t_days is None:
+            self._t_days = ((self._dates64 - self._dates64[0])
+                            / np.timedelta64(1, 'D'))
+        return self._t_days
+
     def get_statistics(self) -> Dict:
         """Statistiques descriptives."""
-        return {
-            'n_points': self.n_points,
-            'min': self.min_level,
-            'max': self.max_level,
-            'mean': self.mean_level,
-            'std': self.std_level,
-            'amplitude': self.amplitude,
-            'range': (self.min_level, self.max_level)
-        }
+        if self._stats is None:
+            self._stats = {
+                'n_points': self.n_points,
+                'min': self.min_level,
+                'max': self.max_level,
+                'mean': self.mean_level,
+                'std': self.std_level,
+                'amplitude': self.amplitude,
+                'range': (self.min_level, self.max_level)
+            }
+        return self._stats
     
     def compute_trend(self) -> Dict:
         """
@@ -56,15 +139,18 @@ class PiezoAnalysis:
         Returns:
             Dict avec slope (m/year), intercept, r², interpretation
         """
-        # Convertir dates en jours depuis première mesure
-        t_days = np.array([(d - self.dates[0]).days for d in self.dates], dtype=float)
-        
+        if self._trend is not None:
+            return self._trend
+
+        # Convertir dates en jours depuis première mesure (vectorisé, en cache)
+        t_days = self._elapsed_days()
+
         # Fit linéaire
         slope_days, intercept, r_value, p_value, std_err = stats.linregress(t_days, self.levels)
-        
+
         # Conversion en m/year
         slope_year = slope_days * 365.25
-        
+
         # Interprétation
         if abs(slope_year) < 0.01:
             trend_type = "Stable"
@@ -72,8 +158,8 @@ class PiezoAnalysis:
             trend_type = f"Hausse ({slope_year:.3f} m/an)"
         else:
             trend_type = f"Baisse ({slope_year:.3f} m/an)"
-        
-        return {
+
+        self._trend = {
             'slope_m_day': slope_days,
             'slope_m_year': slope_year,
             'intercept': intercept,
@@ -82,37 +168,41 @@ class PiezoAnalysis:
             'std_error': std_err,
             'interpretation': trend_type,
             't_days': t_days,
-            'trend_line': intercept + slope_days * t_days
         }
-    
+        return self._trend
+
+    def get_trend_line(self) -> np.ndarray:
+        """Droite de tendance évaluée aux dates de mesure.
+
+        Séparée de compute_trend : les chemins qui ne veulent que la pente
+        (résumés, classification) ne paient pas l'allocation du tableau.
+        """
+        trend = self.compute_trend()
+        return trend['intercept'] + trend['slope_m_day'] * self._elapsed_days()
+
     def identify_aquifer_type(self) -> Dict:
         """
         Classifie le type d'aquifère selon les caractéristiques.
         """
-        # Critères qualitatifs
-        if self.amplitude > 1.0:
-            behavior = "Fort amplitude - Aquifère libre / semi-libre"
-        elif self.amplitude > 0.3:
-            behavior = "Amplitude modérée - Aquifère captif/libre"
-        else:
-            behavior = "Faible amplitude - Aquifère captif / profond"
-        
+        if self._aquifer is not None:
+            return self._aquifer
+
+        # Critères qualitatifs (recherche binaire dans les tables de seuils)
+        behavior = _BEHAVIOR_LABELS[
+            np.searchsorted(_BEHAVIOR_THRESHOLDS, self.amplitude)]
+
         # Réaction aux pluies / saisonnalité
         std_norm = self.std_level / self.mean_level if self.mean_level > 0 else 0
-        
-        if std_norm > 0.1:
-            reactivity = "Très réactif - Aquifère proche surface"
-        elif std_norm > 0.05:
-            reactivity = "Réactif - Aquifère peu profond"
-        else:
-            reactivity = "Peu réactif - Aquifère profond/captif"
-        
-        return {
+        reactivity = _REACTIVITY_LABELS[
+            np.searchsorted(_REACTIVITY_THRESHOLDS, std_norm)]
+
+        self._aquifer = {
             'behavior': behavior,
             'reactivity': reactivity,
             'amplitude_m': self.amplitude,
             'std_normalized': std_norm
         }
+        return self._aquifer
     
     def get_summary(self) -> str:
         """Résumé texte complet."""
@@ -176,6 +266,45 @@ def compute_drawdown_derivative(time: np.ndarray, drawdown: np.ndarray) -> np.nd
     
     d(s)/d(log t) utile pour identifier régimes d'écoulement.
     """
-    log_t = np.log10(time)
+    # En dessous de ~16 points, le coût de dispatch du noyau jitté dépasse
+    # le gain : np.gradient suffit
+    if HAS_NUMBA and len(time) >= 16:
+        return _drawdown_derivative_jit(_as_f64(time), _as_f64(drawdown))
+    log_t = _cached_log10(time)
     ds_dlogt = np.gradient(drawdown, log_t)
     return ds_dlogt
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _drawdown_derivative_jit(time, drawdown):
+        """Différences centrées sur log10(t) sans tableau log_t intermédiaire.
+
+        Même schéma que np.gradient à pas non uniforme.
+        """
+        n = len(time)
+        out = np.empty(n)
+        lt_prev = np.log10(time[0])
+        lt_cur = np.log10(time[1]) if n > 1 else lt_prev
+        out[0] = (drawdown[1] - drawdown[0]) / (lt_cur - lt_prev) if n > 1 else 0.0
+        for i in range(1, n - 1):
+            lt_next = np.log10(time[i + 1])
+            h1 = lt_cur - lt_prev
+            h2 = lt_next - lt_cur
+            out[i] = (h1 * h1 * drawdown[i + 1]
+                      + (h2 * h2 - h1 * h1) * drawdown[i]
+                      - h2 * h2 * drawdown[i - 1]) / (h1 * h2 * (h1 + h2))
+            lt_prev, lt_cur = lt_cur, lt_next
+        if n > 1:
+            out[n - 1] = (drawdown[n - 1] - drawdown[n - 2]) / (lt_cur - lt_prev)
+        return out
+
+
+# Préchauffage optionnel des noyaux numba : la compilation (~secondes) se
+# paie au démarrage plutôt qu'à la première analyse de l'utilisateur, et
+# cache=True persiste le binaire pour les lancements suivants. Activé par
+# l'application GUI (HYDROAPP_PRECOMPILE_NUMBA=1), jamais par défaut pour
+# ne pas ralentir les outils en ligne de commande.
+if HAS_NUMBA and os.environ.get('HYDROAPP_PRECOMPILE_NUMBA'):
+    _piezo_stats(np.zeros(4))
+    _drawdown_derivative_jit(np.array([1.0, 2.0, 4.0, 8.0]), np.zeros(4))
@@ -14,13 +14,44 @@ References:
 """
 
 import numpy as np
-from scipy.optimize import curve_fit
+from scipy.optimize import least_squares
 from typing import Dict, Optional
 import logging
 
+from ._arrays import _as_f64
+
 logger = logging.getLogger(__name__)
 
 
+def _porchet_forward(t: np.ndarray, H0: float, r: float, K: float) -> np.ndarray:
+    """
+    Modèle direct Porchet : H(t) = (H0^(2/3) - (2*K/r)*t)^(3/2).
+
+    Fonction de module pure (pas d'état d'instance) : curve_fit l'appelle
+    des dizaines de fois par ajustement.
+    """
+    # `term` est déjà un tampon frais : écrêtage et puissance en place,
+    # pas de nouveau tableau par appel de curve_fit (t n'est pas modifié)
+    term = H0 ** (2.0 / 3.0) - (2.0 * K / r) * t
+    # Éviter racine de nombre négatif
+    np.clip(term, 0.0, None, out=term)
+    return np.power(term, 1.5, out=term)
+
+
+def _porchet_jacobian(t: np.ndarray, H0: float, r: float, K: float) -> np.ndarray:
+    """
+    Jacobien analytique dH/dK = -(3*t/r) * sqrt(H0^(2/3) - 2*K*t/r).
+
+    Fourni à curve_fit pour éviter les différences finies (2 appels du
+    modèle direct en plus par itération). Nul là où H est écrêté à 0.
+    """
+    term = H0 ** (2.0 / 3.0) - (2.0 * K / r) * t
+    np.clip(term, 0.0, None, out=term)
+    np.sqrt(term, out=term)
+    term *= -(3.0 / r) * t
+    return term.reshape(-1, 1)
+
+
 class PorchetTest:
     """
     Test Porchet pour formation meuble (graviers, sables).
@@ -54,13 +85,7 @@ class PorchetTest:
         Pour simplification numérique :
         H(t) = (H0^(2/3) - (2*K/r)*t)^(3/2)
         """
-        H0_2_3 = self.initial_head ** (2.0/3.0)
-        coeff = 2 * K / self.radius
-        term = H0_2_3 - coeff * t
-        
-        # Éviter racine de nombre négatif
-        term = np.maximum(term, 0)
-        return term ** (3.0/2.0)
+        return _porchet_forward(t, self.initial_head, self.radius, K)
     
     def fit(self, times: np.ndarray, heads: np.ndarray) -> Dict:
         """
@@ -73,28 +98,38 @@ class PorchetTest:
         Returns:
             Dict avec K, rmse, parameters
         """
-        self.times = np.asarray(times, dtype=float)
-        self.heads = np.asarray(heads, dtype=float)
+        self.times = _as_f64(times)
+        self.heads = _as_f64(heads)
         
         try:
-            # Fit avec K comme paramètre
-            params, _ = curve_fit(
-                self._porchet_analytical,
-                self.times,
-                self.heads,
-                p0=[1e-4],  # Initialisation K
-                maxfev=2000,
-                bounds=(1e-7, 1e-2)
+            # least_squares direct : même algorithme que curve_fit sans sa
+            # couche d'emballage (sigma, infodict...) par itération
+            result = least_squares(
+                lambda p: _porchet_forward(
+                    self.times, self.initial_head, self.radius, p[0]
+                ) - self.heads,
+                x0=[1e-4],  # Initialisation K
+                # Jacobien analytique : pas de différences finies
+                jac=lambda p: _porchet_jacobian(
+                    self.times, self.initial_head, self.radius, p[0]),
+                bounds=([1e-7], [1e-2]),
+                method='trf',
+                x_scale=[1e-4],
+                max_nfev=2000
             )
-            self.K = params[0]
+            if not result.success:
+                raise RuntimeError(result.message)
+            self.K = result.x[0]
         except Exception as e:
             logger.error(f"Fit Porchet échoué: {e}")
             return {'success': False, 'error': str(e)}
         
-        # Résidus
+        # Résidus : h_calc sert de tampon (écarts puis carrés en place),
+        # aucun tableau intermédiaire supplémentaire
         h_calc = self._porchet_analytical(self.times, self.K)
-        residuals = self.heads - h_calc
-        rmse = np.sqrt(np.mean(residuals**2))
+        np.subtract(self.heads, h_calc, out=h_calc)
+        np.square(h_calc, out=h_calc)
+        rmse = np.sqrt(h_calc.mean())
         
         logger.info(f"Porchet: K={self.K:.2e} m/s, RMSE={rmse:.4f} m")
         
@@ -12,15 +12,111 @@ Références :
 - Domenico & Schwartz (1998) "Physical and Chemical Hydrogeology"
 """
 
+import os
+import threading
+
 import numpy as np
 from scipy.special import exp1
 from scipy.optimize import curve_fit
 from typing import Tuple, Dict, Optional, List
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
+from ._arrays import TimeContext, _as_f64
+from ._exp1_numba import HAS_NUMBA, exp1_into
+
 logger = logging.getLogger(__name__)
 
 
+# Noyau fusionné : u, W(u) et la mise à l'échelle en une seule passe sur
+# les temps, écrite directement dans un tampon — aucune des ~4 allocations
+# intermédiaires de la version numpy naïve
+if HAS_NUMBA:
+    from numba import njit, prange
+
+    from ._exp1_numba import _exp1_scalar
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _theis_kernel(times, r2, Q, T, S, out):
+        c = Q / (4 * np.pi * T)
+        k = (r2 * S) / (4 * T)
+        for i in prange(times.size):
+            u = k / times[i]
+            # E1(30) ≈ 3e-15 : rabattement nul à la précision utile,
+            # inutile de payer la transcendante (temps très courts)
+            if u > 30.0:
+                out[i] = 0.0
+            else:
+                out[i] = c * _exp1_scalar(u)
+        return out
+else:
+    def _theis_kernel(times, r2, Q, T, S, out):
+        c = Q / (4 * np.pi * T)
+        k = (r2 * S) / (4 * T)
+        np.divide(k, times, out=out)
+        mask = out < 30.0
+        if mask.all():
+            exp1_into(out, out)
+        else:
+            # E1 seulement sur les u utiles ; au-delà de 30, E1 ≈ 3e-15
+            # et le rabattement est nul à la précision utile
+            small = out[mask]
+            out.fill(0.0)
+            out[mask] = exp1_into(small, small)
+        out *= c
+        return out
+
+
+if HAS_NUMBA:
+    from numba import cfunc, types as _nb_types
+
+    # Forme (n, xx) de quad : xx[0] = t, la suite vient de args=(Q, T, S, r)
+    @cfunc(_nb_types.float64(_nb_types.intc,
+                             _nb_types.CPointer(_nb_types.float64)),
+           cache=True)
+    def _theis_quad_cfunc(n, xx):
+        t, Q, T, S, r = xx[0], xx[1], xx[2], xx[3], xx[4]
+        u = (r * r * S) / (4 * T * t)
+        return Q / (4 * np.pi * T) * _exp1_scalar(u)
+
+
+def as_lowlevelcallable():
+    """
+    Rabattement Theis sous forme intégrable par scipy.integrate.quad.
+
+    Avec numba, renvoie un scipy.LowLevelCallable (cfunc compilée) : quad
+    appelle directement le code natif sans repasser par l'interpréteur à
+    chaque évaluation. Sans numba, renvoie une fonction Python équivalente.
+
+    Usage :
+        quad(theis.as_lowlevelcallable(), t0, t1, args=(Q, T, S, r))
+    """
+    if HAS_NUMBA:
+        import scipy
+        return scipy.LowLevelCallable(_theis_quad_cfunc.ctypes)
+
+    def _theis_integrand(t, Q, T, S, r):
+        return theis_drawdown(Q, T, S, r, t)
+    return _theis_integrand
+
+
+# Tampons de fit réutilisés par taille de jeu de temps : u, W(u) et les
+# deux colonnes de la jacobienne sont alloués une fois par signature au
+# lieu de l'être à chaque itération de l'optimiseur. Rangés par thread,
+# fit_bootstrap lançant des fits concurrents sur les mêmes tailles.
+_FIT_BUFFERS = threading.local()
+
+
+def _fit_buffers(n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    cache = getattr(_FIT_BUFFERS, 'cache', None)
+    if cache is None:
+        cache = _FIT_BUFFERS.cache = {}
+    bufs = cache.get(n)
+    if bufs is None:
+        bufs = cache[n] = (np.empty(n), np.empty(n), np.empty((n, 2)))
+    return bufs
+
+
 class TheisAnalysis:
     """
     Classe pour l'analyse Theis des essais de pompage.
@@ -34,22 +130,45 @@ class TheisAnalysis:
         S (float): Coefficient d'emmagasinement
         u_values (np.ndarray): Paramètre dimensionnel u = r²S/(4*T*t)
     """
-    
-    def __init__(self, Q: float, distance: float, times: np.ndarray, drawdowns: np.ndarray):
+
+    # Attributs figés : pas de __dict__ par instance — les campagnes
+    # d'essais multi-puits (et fit_bootstrap) créent des milliers
+    # d'instances, l'accès aux attributs devient un chargement à offset
+    __slots__ = ('Q', 'distance', 'times', 'drawdowns',
+                 '_r2', '_inv_times', '_r2_over_4t', '_u_buf', '_s_buf',
+                 'T', 'S', 'u_values', 'calculated_drawdowns',
+                 'residuals', 'rmse')
+
+    def __init__(self, Q: float, distance: float, times: np.ndarray, drawdowns: np.ndarray,
+                 time_ctx: Optional[TimeContext] = None):
         """
         Initialise l'analyse Theis.
-        
+
         Args:
             Q (float): Débit de pompage (m³/s)
             distance (float): Distance puits-piézomètre (m)
             times (np.ndarray): Vecteur temps (s)
             drawdowns (np.ndarray): Rabattements mesurés (m)
+            time_ctx (TimeContext, optional): Prétraitements de l'axe de
+                temps partagés avec une autre analyse sur les mêmes temps
         """
         self.Q = Q
         self.distance = distance
-        self.times = np.asarray(times, dtype=float)
-        self.drawdowns = np.asarray(drawdowns, dtype=float)
-        
+        if time_ctx is None:
+            time_ctx = TimeContext(times)
+        self.times = time_ctx.t
+        self.drawdowns = _as_f64(drawdowns)
+        # Facteur r²/(4t) précalculé : calculate_u est rappelé à chaque
+        # itération de l'optimiseur avec distance et temps fixes, il ne
+        # reste alors qu'une multiplication scalaire×tableau par appel
+        self._r2 = distance**2
+        self._inv_times = time_ctx.inv_t
+        self._r2_over_4t = self._r2 * time_ctx.inv_4t
+        # Tampons réutilisés par calculate_u/theis_curve : pas
+        # d'allocation par itération de l'optimiseur
+        self._u_buf = np.empty_like(self.times)
+        self._s_buf = np.empty_like(self.times)
+
         self.T = None
         self.S = None
         self.u_values = None
@@ -78,13 +197,15 @@ class TheisAnalysis:
         
         Args:
             T (float): Transmissivité (m²/s)
-            
+
         Returns:
-            np.ndarray: Vecteur u
+            np.ndarray: Vecteur u (tampon interne, réécrit à l'appel suivant)
         """
         if T <= 0:
             raise ValueError("Transmissivité T doit être positive")
-        return (self.distance**2 * self.S) / (4 * T * self.times)
+        # Équivaut à (r²*S) / (4*T*t), avec r²/(4t) figé à l'initialisation ;
+        # écrit en place dans le tampon, aucune allocation par appel
+        return np.multiply(self._r2_over_4t, self.S / T, out=self._u_buf)
     
     def theis_curve(self, T: float) -> np.ndarray:
         """
@@ -98,17 +219,40 @@ class TheisAnalysis:
         Returns:
             np.ndarray: Rabattements théoriques (m)
         """
-        u = self.calculate_u(T)
-        W_u = self.well_function(u)
-        s_theo = (self.Q / (4 * np.pi * T)) * W_u
-        return s_theo
+        if T <= 0:
+            raise ValueError("Transmissivité T doit être positive")
+        return _theis_kernel(self.times, self._r2, self.Q, T, self.S,
+                             self._s_buf)
     
-    def fit(self, initial_T: Optional[float] = None, S_fix: Optional[float] = None) -> Dict:
+    def _grid_seed(self, n_grid: int = 30) -> list:
+        """
+        Amorce (log T, log S) par balayage d'une grille log-espacée.
+
+        La somme des carrés des écarts est évaluée sur toute la grille en
+        une seule expression broadcastée (n_grid × n_grid × n_temps), sans
+        boucle Python, puis la meilleure cellule sert de point de départ à
+        l'optimisation locale.
+
+        Returns:
+            [log(T_seed), log(S_seed)]
+        """
+        T_grid = np.logspace(-6, -1, n_grid)
+        S_grid = np.logspace(-6, -1, n_grid)
+        u = (self._r2 * S_grid[None, :, None]
+             / (4 * T_grid[:, None, None] * self.times[None, None, :]))
+        s = self.Q / (4 * np.pi * T_grid[:, None, None]) * exp1(u)
+        sse = ((s - self.drawdowns) ** 2).sum(axis=-1)
+        i, j = np.unravel_index(np.argmin(sse), sse.shape)
+        return [np.log(T_grid[i]), np.log(S_grid[j])]
+
+    def fit(self, initial_T: Optional[float] = None, S_fix: Optional[float] = None,
+            initial_S: Optional[float] = None) -> Dict:
         """
         Estime T et S par ajustement aux données mesurées.
         
         Args:
             initial_T (float, optional): Valeur initiale de T pour l'optimisation
+            initial_S (float, optional): Valeur initiale de S (1e-4 par défaut)
             S_fix (float, optional): Si fourni, S est fixé à cette valeur et seul T est estimé
             
         Returns:
@@ -122,42 +266,109 @@ class TheisAnalysis:
         
         if len(self.drawdowns) < 2:
             raise ValueError("Au moins 2 mesures sont nécessaires")
-        
-        # Initialisation
-        if initial_T is None:
-            initial_T = 1e-3
-        
+
+        # Ajustement en log(T), log(S) : le problème est lisse et les
+        # paramètres hydrogéologiques vivent en échelle log — curve_fit
+        # (moindres carrés à gradient) converge en quelques évaluations là
+        # où Nelder-Mead en demandait des centaines, et l'exponentielle
+        # garantit la positivité sans pénalité 1e10
+
+        # Jacobienne analytique : en posant A = Q/(4πT)·e⁻ᵘ et
+        # s = Q/(4πT)·W(u), les dérivées par rapport aux log-paramètres
+        # sont ∂s/∂logT = A - s et ∂s/∂logS = -A (règle de la chaîne sur
+        # W'(u) = -e⁻ᵘ/u). Évite les évaluations exp1 supplémentaires des
+        # différences finies à chaque pas.
+
+        u_buf, W_buf, J_buf = _fit_buffers(len(self.times))
+
+        # Constantes sorties des fermetures : Q/(4π) ne dépend pas des
+        # paramètres, seul /T reste à payer par itération (r²/(4t) est
+        # déjà précalculé dans __init__)
+        Q_over_4pi = self.Q / (4 * np.pi)
+
+        # Bornes physiques en échelle log : T ∈ [1e-8, 1e-1] m²/s,
+        # S ∈ [1e-8, 1[ — la région de confiance ne gaspille plus
+        # d'itérations dans les régimes non physiques sur données
+        # bruitées (p0 serré dans les bornes par sécurité)
+        _LOG_LO, _LOG_HI = np.log(1e-8), np.log(1e-1)
+        _LOG_S_HI = -1e-12  # S < 1, strictement
+
+        # Mémo du dernier point évalué : least_squares appelle le modèle
+        # puis la jacobienne aux mêmes paramètres — u et W(u), partagés
+        # par les deux, ne sont calculés qu'une fois par itération
+        last_params = [None]
+
+        def _update(T, S_val, key):
+            if last_params[0] != key:
+                np.multiply(self._r2_over_4t, S_val / T, out=u_buf)
+                exp1_into(u_buf, W_buf)
+                last_params[0] = key
+
         # Cas 1 : S est connu, estimer T seul
         if S_fix is not None:
             self.S = S_fix
-            
-            def objective(T):
-                if T <= 0:
-                    return 1e10
-                return np.sum((self.theis_curve(T) - self.drawdowns)**2)
-            
-            from scipy.optimize import minimize_scalar
-            result = minimize_scalar(objective, bounds=(1e-6, 1), method='bounded')
-            self.T = result.x
-            
+            if initial_T is None:
+                initial_T = 1e-3
+
+            def model(t_arr, logT):
+                T = np.exp(logT)
+                _update(T, S_fix, logT)
+                return (Q_over_4pi / T) * W_buf
+
+            def jac(t_arr, logT):
+                T = np.exp(logT)
+                factor = Q_over_4pi / T
+                _update(T, S_fix, logT)
+                # e⁻ᵘ construit dans la colonne jacobienne, u_buf préservé
+                np.negative(u_buf, out=J_buf[:, 0])
+                np.exp(J_buf[:, 0], out=J_buf[:, 0])
+                np.subtract(J_buf[:, 0], W_buf, out=J_buf[:, 0])
+                J_buf[:, 0] *= factor
+                return J_buf[:, :1]
+
+            p0 = np.clip(np.log(initial_T), _LOG_LO, _LOG_HI)
+            popt, _ = curve_fit(model, self.times, self.drawdowns,
+                                p0=[p0], method='trf', jac=jac,
+                                bounds=([_LOG_LO], [_LOG_HI]))
+            self.T = float(np.exp(popt[0]))
+
         else:
-            # Cas 2 : Estimer T et S ensemble
-            # Initialiser S
-            self.S = 1e-4
-            
-            def objective(params):
-                T, S = params
-                if T <= 0 or S <= 0:
-                    return 1e10
-                self.S = S
-                return np.sum((self.theis_curve(T) - self.drawdowns)**2)
-            
-            from scipy.optimize import minimize
-            result = minimize(objective, [initial_T, 1e-4], method='Nelder-Mead')
-            self.T, self.S = result.x
+            # Cas 2 : Estimer T et S ensemble. Sans estimation initiale,
+            # un balayage de grille log localise d'abord le bassin global :
+            # depuis un p0 arbitraire l'optimisation locale peut caler sur
+            # un minimum secondaire du paysage (T, S)
+            if initial_T is None:
+                p0 = self._grid_seed()
+            else:
+                p0 = [np.log(initial_T),
+                      np.log(initial_S if initial_S is not None else 1e-4)]
+            bounds = ([_LOG_LO, _LOG_LO], [_LOG_HI, _LOG_S_HI])
+            p0 = np.clip(p0, bounds[0], bounds[1])
+
+            def model(t_arr, logT, logS):
+                T = np.exp(logT)
+                _update(T, np.exp(logS), (logT, logS))
+                return (Q_over_4pi / T) * W_buf
+
+            def jac(t_arr, logT, logS):
+                T = np.exp(logT)
+                factor = Q_over_4pi / T
+                _update(T, np.exp(logS), (logT, logS))
+                # e⁻ᵘ construit dans la colonne 1 (u_buf préservé) :
+                # col 0 = factor·(e⁻ᵘ - W), col 1 = -factor·e⁻ᵘ
+                np.negative(u_buf, out=J_buf[:, 1])
+                np.exp(J_buf[:, 1], out=J_buf[:, 1])
+                np.subtract(J_buf[:, 1], W_buf, out=J_buf[:, 0])
+                J_buf[:, 0] *= factor
+                J_buf[:, 1] *= -factor
+                return J_buf
+
+            popt, _ = curve_fit(model, self.times, self.drawdowns,
+                                p0=p0, method='trf', jac=jac, bounds=bounds)
+            self.T, self.S = (float(v) for v in np.exp(popt))
         
-        # Calcul des résidus
-        self.calculated_drawdowns = self.theis_curve(self.T)
+        # Calcul des résidus (copie : theis_curve rend le tampon partagé)
+        self.calculated_drawdowns = self.theis_curve(self.T).copy()
         self.residuals = self.drawdowns - self.calculated_drawdowns
         self.rmse = np.sqrt(np.mean(self.residuals**2))
         
@@ -175,26 +386,92 @@ class TheisAnalysis:
             }
         }
     
+    def fit_bootstrap(self, n: int = 200, sigma: Optional[float] = None,
+                      workers: int = -1, seed: Optional[int] = None) -> Dict:
+        """
+        Intervalles de confiance de T et S par bootstrap Monte-Carlo.
+
+        Rejoue `n` ajustements indépendants sur les données rebruitées
+        (écart-type `sigma`, par défaut le RMSE du fit de référence) et en
+        tire les percentiles 2.5/50/97.5. Les fits sont répartis sur un
+        pool de threads : chaque réplique travaille sur sa propre instance
+        et l'essentiel du temps se passe dans scipy/numpy.
+
+        Args:
+            n: Nombre de répliques bootstrap
+            sigma: Écart-type du bruit ajouté (m) ; RMSE du fit si None
+            workers: Threads (-1 = nombre de cœurs)
+            seed: Graine du générateur pour des répliques reproductibles
+
+        Returns:
+            Dict avec T, S (fit de référence), T_ci, S_ci (2.5-97.5 %),
+            T_samples, S_samples, n_valid, success
+        """
+        base = self.fit()
+        if sigma is None:
+            sigma = self.rmse
+
+        rng = np.random.default_rng(seed)
+        noises = sigma * rng.standard_normal((n, len(self.drawdowns)))
+
+        def _one_fit(noise):
+            replica = TheisAnalysis(self.Q, self.distance, self.times,
+                                    self.drawdowns + noise)
+            try:
+                result = replica.fit(initial_T=base['T'],
+                                     initial_S=base['S'])
+                return result['T'], result['S']
+            except Exception:
+                return np.nan, np.nan
+
+        max_workers = os.cpu_count() if workers == -1 else workers
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            samples = np.array(list(pool.map(_one_fit, noises)))
+
+        valid = np.isfinite(samples).all(axis=1)
+        T_samples, S_samples = samples[valid, 0], samples[valid, 1]
+
+        T_pct = np.percentile(T_samples, [2.5, 50, 97.5])
+        S_pct = np.percentile(S_samples, [2.5, 50, 97.5])
+
+        logger.info(f"Theis bootstrap ({int(valid.sum())}/{n} fits): "
+                    f"T ∈ [{T_pct[0]:.2e}, {T_pct[2]:.2e}], "
+                    f"S ∈ [{S_pct[0]:.2e}, {S_pct[2]:.2e}]")
+
+        return {
+            'T': base['T'],
+            'S': base['S'],
+            'T_ci': (T_pct[0], T_pct[2]),
+            'S_ci': (S_pct[0], S_pct[2]),
+            'T_median': T_pct[1],
+            'S_median': S_pct[1],
+            'T_samples': T_samples,
+            'S_samples': S_samples,
+            'n_valid': int(valid.sum()),
+            'success': base['success'] and valid.sum() >= n // 2
+        }
+
     def generate_curve(self, T: float, S: float, t_range: np.ndarray) -> Dict:
         """
         Génère la courbe complète Theis pour paramètres donnés.
         
+        Fonction pure : ne touche ni aux temps mesurés ni à l'état du fit
+        (T, S, facteurs précalculés) — un tracé sur une plage arbitraire
+        ne peut plus corrompre un fit ultérieur.
+
         Args:
             T (float): Transmissivité (m²/s)
             S (float): Coefficient d'emmagasinement
             t_range (np.ndarray): Vecteur temps pour la génération (s)
-            
+
         Returns:
             Dict contenant 't', 's', 'u', 'W_u'
         """
-        self.T = T
-        self.S = S
-        self.times = np.asarray(t_range)
-        
-        u = self.calculate_u(T)
+        t_range = _as_f64(t_range)
+        u = (self._r2 * S) / (4 * T * t_range)
         W_u = self.well_function(u)
         s = (self.Q / (4 * np.pi * T)) * W_u
-        
+
         return {
             'time': t_range,
             'drawdown': s,
@@ -241,22 +518,54 @@ def estimate_transmissivity_theis(Q: float, distance: float, times: np.ndarray,
     return result['T'], result['S']
 
 
-def theis_drawdown(Q: float, T: float, S: float, distance: float, time: float) -> float:
+def theis_drawdown(Q: float, T: float, S: float, distance: float, time) -> float:
     """
     Calcule le rabattement Theis à un instant t.
-    
+
     s(r,t) = Q / (4πT) * W(u)  avec  u = r²S / (4Tt)
-    
+
     Args:
         Q: Débit (m³/s)
         T: Transmissivité (m²/s)
         S: Coefficient d'emmagasinement
         distance: Distance (m)
-        time: Temps (s)
-        
+        time: Temps (s), scalaire ou tableau (broadcast numpy, même
+            convention que cooper_jacob_drawdown)
+
+    Returns:
+        Rabattement (m), scalaire ou tableau selon `time`
+    """
+    if np.ndim(time) == 0:
+        u = (distance**2 * S) / (4 * T * time)
+        return (Q / (4 * np.pi * T)) * exp1(u)
+    return theis_drawdown_vec(Q, T, S, distance, time)
+
+
+def theis_drawdown_vec(Q: float, T: float, S: float, distance: float,
+                       times: np.ndarray) -> np.ndarray:
+    """
+    Rabattement Theis sur un tableau de temps.
+
+    exp1 est une ufunc numpy : un seul appel vectorisé remplace la
+    compréhension `[theis_drawdown(..., t) for t in times]`.
+
+    Args:
+        Q: Débit (m³/s)
+        T: Transmissivité (m²/s)
+        S: Coefficient d'emmagasinement
+        distance: Distance (m)
+        times: Temps (s)
+
     Returns:
-        Rabattement (m)
+        Rabattements (m)
     """
-    u = (distance**2 * S) / (4 * T * time)
-    W_u = exp1(u)
-    return (Q / (4 * np.pi * T)) * W_u
+    times = _as_f64(times)
+    return _theis_kernel(times, distance**2, Q, T, S, np.empty_like(times))
+
+
+# Préchauffage optionnel du noyau fusionné : la compilation se paie au
+# démarrage de l'application (HYDROAPP_PRECOMPILE_NUMBA=1) et non au
+# premier fit de l'utilisateur ; voir core/calculations/piezo.py
+if HAS_NUMBA and os.environ.get('HYDROAPP_PRECOMPILE_NUMBA'):
+    _theis_kernel(np.array([1.0, 2.0, 4.0, 8.0]), 1.0, 1e-3, 1e-3, 1e-4,
+                  np.empty(4))
@@ -20,7 +20,7 @@ from core.calculations import theis, cooper_jacob, lefranc, lugeon, porchet, pie
 from core.ai import AnomalyDetector, ParameterRecommender, PreComputeValidator
 
 
-def demo_theis():
+def demo_theis(rng):
     """Démonstration essai Theis."""
     print("\n" + "="*70)
     print("DÉMO 1 : ESSAI THEIS")
@@ -34,10 +34,10 @@ def demo_theis():
     # Générer données "vraies"
     T_true = 1e-3  # m²/s
     S_true = 1e-4
-    drawdowns = np.array([theis.theis_drawdown(Q, T_true, S_true, distance, t) 
-                          for t in times])
+    # Appel vectorisé : exp1 traite tout le vecteur temps d'un coup
+    drawdowns = theis.theis_drawdown_vec(Q, T_true, S_true, distance, times)
     # Ajouter bruit
-    drawdowns += np.random.normal(0, 0.001, len(drawdowns))
+    drawdowns += 0.001 * rng.standard_normal(len(drawdowns))
     
     print(f"\nParamètres vrais: T={T_true:.2e} m²/s, S={S_true:.2e}")
     print(f"Données mesurées : {len(times)} points")
@@ -54,7 +54,7 @@ def demo_theis():
     print(f"  Succès:     {result['success']}")
 
 
-def demo_cooper_jacob():
+def demo_cooper_jacob(rng):
     """Démonstration essai Cooper-Jacob."""
     print("\n" + "="*70)
     print("DÉMO 2 : ESSAI COOPER-JACOB (approximation semi-log)")
@@ -66,9 +66,9 @@ def demo_cooper_jacob():
     
     T_true = 1e-3
     S_true = 1e-4
-    drawdowns = np.array([cooper_jacob.cooper_jacob_drawdown(Q, T_true, S_true, distance, t)
-                          for t in times])
-    drawdowns += np.random.normal(0, 0.001, len(drawdowns))
+    # cooper_jacob_drawdown accepte directement un tableau de temps
+    drawdowns = cooper_jacob.cooper_jacob_drawdown(Q, T_true, S_true, distance, times)
+    drawdowns += 0.001 * rng.standard_normal(len(drawdowns))
     
     print(f"\nParamètres vrais: T={T_true:.2e}, S={S_true:.2e}")
     
@@ -83,7 +83,7 @@ def demo_cooper_jacob():
     print(f"  RMSE:           {result['rmse']:.6f} m")
 
 
-def demo_lefranc():
+def demo_lefranc(rng):
     """Démonstration test Lefranc."""
     print("\n" + "="*70)
     print("DÉMO 3 : TEST LEFRANC (perméabilité)")
@@ -96,7 +96,7 @@ def demo_lefranc():
     tau = 50  # constante de temps
     
     heads = h_infty + (h_initial - h_infty) * np.exp(-times / tau)
-    heads += np.random.normal(0, 0.001, len(heads))
+    heads += 0.001 * rng.standard_normal(len(heads))
     
     print(f"\nDonnées test de charge (cylindre de forage)")
     print(f"Charge initiale: {h_initial:.3f} m")
@@ -122,10 +122,8 @@ def demo_lugeon():
     test_length = 5.0  # m
     test = lugeon.LugeonTest(test_length)
     
-    # Ajouter mesures
-    test.add_measurement(10, 2.5)   # 10 bar, 2.5 L/min
-    test.add_measurement(10, 2.3)   # Répétition
-    test.add_measurement(10, 2.4)
+    # Ajouter les mesures en lot (trois paliers à 10 bar)
+    test.add_measurements([10, 10, 10], [2.5, 2.3, 2.4])
     
     result = test.compute_mean_k()
     
@@ -138,7 +136,7 @@ def demo_lugeon():
     print(test.get_summary())
 
 
-def demo_porchet():
+def demo_porchet(rng):
     """Démonstration test Porchet."""
     print("\n" + "="*70)
     print("DÉMO 5 : TEST PORCHET (formations meubles)")
@@ -157,8 +155,9 @@ def demo_porchet():
         term = np.maximum(term, 0)
         return term ** (3.0/2.0)
     
-    heads = np.array([porchet_model(t, K_true) for t in times])
-    heads += np.random.normal(0, 0.001, len(heads))
+    # porchet_model est déjà écrit en numpy : appel direct sur le vecteur
+    heads = porchet_model(times, K_true)
+    heads += 0.001 * rng.standard_normal(len(heads))
     
     print(f"\nPuits de {radius:.2f} m de rayon, {H0:.2f} m d'eau initial")
     
@@ -172,21 +171,20 @@ def demo_porchet():
         print(f"  RMSE: {result['rmse']:.4f} m")
 
 
-def demo_piezzometry():
+def demo_piezzometry(rng):
     """Démonstration analyse piézométrique."""
     print("\n" + "="*70)
     print("DÉMO 6 : ANALYSE PIÉZOMÉTRIQUE")
     print("="*70)
     
-    from datetime import datetime, timedelta
-    
-    # Générer série temporelle
-    base_date = datetime(2023, 1, 1)
-    dates = [base_date + timedelta(days=i) for i in range(365)]
-    
+    # Générer série temporelle en datetime64 : 8 octets par date et pas
+    # de boucle d'objets datetime Python (PiezoAnalysis travaille déjà
+    # en datetime64 en interne)
+    dates = np.arange(np.datetime64('2023-01-01'), np.datetime64('2024-01-01'))
+
     # Niveau avec tendance et saisonnalité
     t = np.arange(365) / 365
-    levels = 10 + 0.5 * t + 0.3 * np.sin(2*np.pi*t) + np.random.normal(0, 0.02, 365)
+    levels = 10 + 0.5 * t + 0.3 * np.sin(2*np.pi*t) + 0.02 * rng.standard_normal(365)
     
     print(f"\nSérie piézométrique: {len(dates)} mesures sur 1 an")
     
@@ -301,13 +299,17 @@ def main():
     print("  ✓ Analyse piézométrique")
     print("  ✓ Module IA assistant pédagogique")
     
+    # Générateur moderne (PCG64) instancié une fois : plus rapide que le
+    # RNG global hérité (verrou + Mersenne Twister) et démos reproductibles
+    rng = np.random.default_rng(42)
+    
     try:
-        demo_theis()
-        demo_cooper_jacob()
-        demo_lefranc()
+        demo_theis(rng)
+        demo_cooper_jacob(rng)
+        demo_lefranc(rng)
         demo_lugeon()
-        demo_porchet()
-        demo_piezzometry()
+        demo_porchet(rng)
+        demo_piezzometry(rng)
         demo_ia_anomalies()
         demo_ia_recommendations()
         demo_ia_validation()
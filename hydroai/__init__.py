@@ -0,0 +1,7 @@
+"""
+Paquet hydroai - point d'entrée unique de l'application
+=======================================================
+
+`python -m hydroai` remplace les anciens lanceurs dispersés à la racine
+(launcher.py, launcher_auto.py, run*.py), devenus de simples délégations.
+"""
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Point d'entrée unique HydroAI
+=============================
+
+Consolide les lanceurs historiques (launcher.py, launcher_auto.py,
+run*.py) en un seul module à sous-commandes :
+
+    python -m hydroai            # interface principale
+    python -m hydroai simple     # interface simplifiée
+    python -m hydroai check      # vérifie les dépendances (sans les charger)
+    python -m hydroai install    # installe les manquantes puis lance
+"""
+
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+# Racine du projet dans le path (les shims à la racine en dépendent)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+DEPENDENCIES = {
+    'numpy': 'Calculs scientifiques',
+    'scipy': 'Algorithmes optimization',
+    'pandas': 'Gestion données',
+    'matplotlib': 'Visualisation graphiques',
+    'PySide6': 'Interface utilisateur',
+    'reportlab': 'Export PDF',
+}
+
+
+def check_dependencies(verbose: bool = True) -> list:
+    """
+    Liste les dépendances manquantes.
+
+    find_spec localise un paquet sans l'exécuter : la vérification ne paie
+    plus l'import complet de numpy/scipy/PySide6 (plusieurs centaines de
+    millisecondes à froid) que provoquait l'ancien `__import__(pkg)`.
+    """
+    missing = []
+    for pkg, desc in DEPENDENCIES.items():
+        if importlib.util.find_spec(pkg) is not None:
+            if verbose:
+                print(f"  ✓ {pkg:15} - {desc}")
+        else:
+            if verbose:
+                print(f"  ✗ {pkg:15} - {desc} [MANQUANT]")
+            missing.append(pkg)
+    return missing
+
+
+def install_missing(missing) -> None:
+    """Installe via pip les paquets listés."""
+    for pkg in missing:
+        print(f"  ✗ {pkg} - Installation en cours...")
+        subprocess.check_call([sys.executable, '-m', 'pip', 'install',
+                               pkg, '--quiet'])
+        print(f"  ✓ {pkg} installé")
+
+
+def launch(simple: bool = False) -> None:
+    """
+    Lance l'interface graphique.
+
+    L'import de l'application (qui tire numpy/scipy/PySide6) est différé
+    jusqu'ici : `check` et la phase d'installation ne le paient pas.
+    """
+    missing = check_dependencies(verbose=False)
+    if missing:
+        print(f"Paquets manquants: {', '.join(missing)}")
+        print("Installation: pip install " + " ".join(missing)
+              + "  (ou: python -m hydroai install)")
+        sys.exit(1)
+
+    print("Démarrage de HydroAI...")
+    print("-" * 60)
+
+    try:
+        if simple:
+            from app.main_app_simple import main as app_main
+        else:
+            from app.main_app import main as app_main
+        app_main()
+    except Exception as e:
+        print(f"\n✗ ERREUR LANCEMENT: {e}")
+        print("\nVérifiez que tous les modules sont présents:")
+        print("  - core/calculations/ (theis, cooper_jacob, etc.)")
+        print("  - core/ai/ (anomaly_detection, etc.)")
+        print("  - app/ui/tabs/ (home_tab, essais_pompage_tab, etc.)")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+def main(argv=None) -> None:
+    """Répartit vers la sous-commande (gui par défaut)."""
+    args = sys.argv[1:] if argv is None else argv
+    command = args[0] if args else 'gui'
+
+    if command == 'check':
+        print("Vérification dépendances HydroAI...")
+        print("-" * 60)
+        missing = check_dependencies()
+        print("-" * 60)
+        if missing:
+            print(f"\nPaquets manquants: {', '.join(missing)}")
+            print("Installation: pip install " + " ".join(missing))
+            sys.exit(1)
+        print("\n✓ Toutes dépendances OK")
+    elif command == 'install':
+        print("Vérification des packages...")
+        missing = check_dependencies(verbose=False)
+        if missing:
+            install_missing(missing)
+        print("\n✓ Tous les packages sont prêts!\n")
+        launch()
+    elif command == 'simple':
+        launch(simple=True)
+    elif command == 'gui':
+        launch()
+    else:
+        print(f"Commande inconnue: {command}")
+        print(__doc__)
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
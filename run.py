@@ -1,16 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""
-Lanceur HydroAI - Point d'entrée principal
-"""
+"""Lanceur HydroAI - délègue au point d'entrée unique (hydroai/__main__.py)."""
 
-import sys
-import os
-
-# Ajouter racine au path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from app.main_app import main
+from hydroai.__main__ import main
 
 if __name__ == "__main__":
-    main()
+    main(['gui'])
@@ -1,16 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""
-Launcher pour HydroAI UI - Version Simplifiée
-"""
+"""Launcher pour HydroAI UI (version simplifiée) - délègue au point d'entrée unique."""
 
-import sys
-import os
+from hydroai.__main__ import main
 
-# Ajouter le répertoire courant au path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-# Lancer l'application
 if __name__ == "__main__":
-    from app.main_app_simple import main
-    main()
+    main(['simple'])